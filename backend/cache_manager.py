@@ -3,9 +3,19 @@ Cache Manager - Handles on-demand caching of scraped data
 """
 import json
 import os
+import hashlib
+import tempfile
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # orjson not installed, use the stdlib json module
+
 # Auto-detect cache directory
 # HF Spaces provides /data for persistent storage, otherwise use backend/cache/
 if os.path.exists('/data'):
@@ -19,6 +29,53 @@ os.makedirs(CACHE_DIR, exist_ok=True)
 # Cache validity period (24 hours)
 CACHE_VALIDITY_HOURS = 24
 
+# Raw HTML page cache: fetched pages are reused for an hour, so re-running a scrape
+# (or scraping several sources that share pages) skips the network entirely
+PAGE_CACHE_DIR = os.path.join(CACHE_DIR, 'pages')
+PAGE_CACHE_VALIDITY_SECONDS = 3600
+PAGE_MEMORY_CACHE_CHARS = 32 * 1024 * 1024  # Most recently used pages also kept in memory, up to this many chars in total
+
+_page_memory = OrderedDict()  # key -> (saved_at, html)
+_page_memory_chars = 0  # Total length of the HTML held in _page_memory
+_page_memory_lock = threading.Lock()
+
+# AI response cache: an identical prompt (same model, same page content, same day)
+# reuses the model's earlier reply instead of paying for another completion
+AI_CACHE_DIR = os.path.join(CACHE_DIR, 'ai')
+AI_CACHE_VALIDITY_SECONDS = 24 * 3600
+
+_last_prune = {}  # directory -> time of last expired-file sweep
+
+
+def _read_json(path: str):
+    """Load a JSON file, using orjson when available"""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+
+def _write_json(path: str, data) -> None:
+    """Write data as indented JSON, using orjson when available"""
+    if orjson:
+        _write_atomic(path, orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        _write_atomic(path, json.dumps(data, indent=2).encode('utf-8'))
+
+
+def _write_atomic(path: str, content: bytes) -> None:
+    """Write to a temp file beside path and rename it into place, so readers never see a partial file"""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
 
 def get_cache_file_path(cache_type: str) -> str:
     """Get the cache file path for a given type"""
@@ -33,8 +90,7 @@ def is_cache_valid(cache_type: str) -> bool:
         return False
 
     try:
-        with open(cache_file, 'r') as f:
-            cache_data = json.load(f)
+        cache_data = _read_json(cache_file)
 
         timestamp_str = cache_data.get('timestamp')
         if not timestamp_str:
@@ -58,8 +114,7 @@ def load_from_cache(cache_type: str) -> Optional[List[Dict]]:
 
     try:
         cache_file = get_cache_file_path(cache_type)
-        with open(cache_file, 'r') as f:
-            cache_data = json.load(f)
+        cache_data = _read_json(cache_file)
 
         print(f"  [CACHE] Loading {cache_type} from cache (age: {get_cache_age_hours(cache_type):.1f}h)")
         return cache_data.get('data', [])
@@ -79,8 +134,7 @@ def save_to_cache(cache_type: str, data: List[Dict]) -> None:
             'count': len(data)
         }
 
-        with open(cache_file, 'w') as f:
-            json.dump(cache_data, f, indent=2)
+        _write_json(cache_file, cache_data)
 
         print(f"  [CACHE] Saved {len(data)} items to {cache_type} cache")
 
@@ -96,8 +150,7 @@ def get_cache_age_hours(cache_type: str) -> float:
         return float('inf')
 
     try:
-        with open(cache_file, 'r') as f:
-            cache_data = json.load(f)
+        cache_data = _read_json(cache_file)
 
         timestamp_str = cache_data.get('timestamp')
         if not timestamp_str:
@@ -112,8 +165,13 @@ def get_cache_age_hours(cache_type: str) -> float:
 
 
 def clear_cache(cache_type: str) -> bool:
-    """Clear cache for a specific type"""
+    """
+    Clear cache for a specific type, along with the page and AI response caches,
+    so the next scrape fetches and extracts every page fresh
+    """
     try:
+        _clear_page_cache()
+        _clear_directory(AI_CACHE_DIR)
         cache_file = get_cache_file_path(cache_type)
         if os.path.exists(cache_file):
             os.remove(cache_file)
@@ -123,3 +181,136 @@ def clear_cache(cache_type: str) -> bool:
     except Exception as e:
         print(f"Error clearing cache: {e}")
         return False
+
+
+def _clear_page_cache() -> None:
+    """Drop every cached page, in memory and on disk"""
+    global _page_memory_chars
+    with _page_memory_lock:
+        _page_memory.clear()
+        _page_memory_chars = 0
+    _clear_directory(PAGE_CACHE_DIR)
+
+
+def _clear_directory(directory: str) -> None:
+    """Delete every file in a cache directory"""
+    if os.path.isdir(directory):
+        for name in os.listdir(directory):
+            try:
+                os.remove(os.path.join(directory, name))
+            except FileNotFoundError:
+                pass  # Removed by a concurrent prune or rename
+
+
+def _page_cache_key(url: str) -> str:
+    """Pages are keyed by URL and calendar day, so a cached page never outlives its date"""
+    day = datetime.now().strftime('%Y-%m-%d')
+    return hashlib.sha256(f"{url}|{day}".encode('utf-8')).hexdigest()
+
+
+def _remember_page(key: str, saved_at: float, html: str) -> None:
+    """Store a page in the in-memory LRU, evicting least recently used pages past PAGE_MEMORY_CACHE_CHARS"""
+    global _page_memory_chars
+    with _page_memory_lock:
+        previous = _page_memory.pop(key, None)
+        if previous:
+            _page_memory_chars -= len(previous[1])
+        _page_memory[key] = (saved_at, html)
+        _page_memory_chars += len(html)
+        while _page_memory_chars > PAGE_MEMORY_CACHE_CHARS:
+            _, (_, evicted_html) = _page_memory.popitem(last=False)
+            _page_memory_chars -= len(evicted_html)
+
+
+def _prune_expired_files(directory: str, validity_seconds: int, now: float) -> None:
+    """Delete expired cache files in a directory (runs at most once per validity period)"""
+    if now - _last_prune.get(directory, 0.0) < validity_seconds:
+        return
+    _last_prune[directory] = now
+
+    try:
+        for name in os.listdir(directory):
+            cached_file = os.path.join(directory, name)
+            if now - os.path.getmtime(cached_file) >= validity_seconds:
+                os.remove(cached_file)
+    except Exception as e:
+        print(f"Error pruning {directory}: {e}")
+
+
+def load_page_from_cache(url: str) -> Optional[str]:
+    """Return the cached HTML for a URL if it was fetched within the last hour"""
+    key = _page_cache_key(url)
+    now = time.time()
+
+    with _page_memory_lock:
+        entry = _page_memory.get(key)
+        if entry and now - entry[0] < PAGE_CACHE_VALIDITY_SECONDS:
+            _page_memory.move_to_end(key)
+            return entry[1]
+
+    page_file = os.path.join(PAGE_CACHE_DIR, f'{key}.html')
+    try:
+        saved_at = os.path.getmtime(page_file)
+        if now - saved_at >= PAGE_CACHE_VALIDITY_SECONDS:
+            return None
+
+        with open(page_file, 'r', encoding='utf-8') as f:
+            html = f.read()
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"Error loading page from cache: {e}")
+        return None
+
+    _remember_page(key, saved_at, html)
+    return html
+
+
+def save_page_to_cache(url: str, html: str) -> None:
+    """Save fetched HTML for a URL to the memory and disk page caches"""
+    key = _page_cache_key(url)
+    now = time.time()
+    _remember_page(key, now, html)
+
+    try:
+        os.makedirs(PAGE_CACHE_DIR, exist_ok=True)
+        _write_atomic(os.path.join(PAGE_CACHE_DIR, f'{key}.html'), html.encode('utf-8'))
+        _prune_expired_files(PAGE_CACHE_DIR, PAGE_CACHE_VALIDITY_SECONDS, now)
+
+    except Exception as e:
+        print(f"Error saving page to cache: {e}")
+
+
+def _ai_cache_key(model: str, prompt: str, response_format: Optional[Dict]) -> str:
+    """Hash of everything that determines the model's reply"""
+    format_key = json.dumps(response_format, sort_keys=True) if response_format else ""
+    return hashlib.sha256(f"{model}\n{format_key}\n{prompt}".encode('utf-8')).hexdigest()
+
+
+def load_ai_response(model: str, prompt: str, response_format: Optional[Dict] = None) -> Optional[str]:
+    """Return the cached reply for this model + prompt + response format if it is less than 24 hours old"""
+    response_file = os.path.join(AI_CACHE_DIR, f'{_ai_cache_key(model, prompt, response_format)}.txt')
+    try:
+        if time.time() - os.path.getmtime(response_file) >= AI_CACHE_VALIDITY_SECONDS:
+            return None
+
+        with open(response_file, 'r', encoding='utf-8') as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"Error loading AI response from cache: {e}")
+        return None
+
+
+def save_ai_response(model: str, prompt: str, response_text: str,
+                     response_format: Optional[Dict] = None) -> None:
+    """Save a model reply so the same prompt can be answered from cache"""
+    try:
+        os.makedirs(AI_CACHE_DIR, exist_ok=True)
+        response_file = os.path.join(AI_CACHE_DIR, f'{_ai_cache_key(model, prompt, response_format)}.txt')
+        _write_atomic(response_file, response_text.encode('utf-8'))
+        _prune_expired_files(AI_CACHE_DIR, AI_CACHE_VALIDITY_SECONDS, time.time())
+
+    except Exception as e:
+        print(f"Error saving AI response to cache: {e}")
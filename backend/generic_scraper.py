@@ -3,20 +3,421 @@ Generic Scraper - Intelligently scrapes events/attractions from any website
 """
 import re
 import requests
-from bs4 import BeautifulSoup
-from datetime import datetime, timedelta
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import DecodeError, ProtocolError, ReadTimeoutError
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, Comment, FeatureNotFound, Tag
+from datetime import date, datetime, timedelta
 from dateutil import parser as dateparser
-from urllib.parse import urljoin
-from typing import List, Dict, Optional
-from openai import OpenAI
+from dateutil.relativedelta import relativedelta
+from urllib.parse import urljoin, urlparse, urlsplit, urlunparse, urlunsplit, parse_qs, parse_qsl, urlencode
+from typing import Callable, List, Dict, Optional
+from openai import OpenAI, APIConnectionError, RateLimitError
 import os
+import html
 import json
+import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+
+try:
+    from . import cache_manager
+except ImportError:
+    import cache_manager
+
+# orjson (in requirements.txt) parses AI replies several times faster than the stdlib;
+# fall back to json where it isn't installed. Public so main.py can parse its replies with it too
+try:
+    import orjson
+    json_loads = orjson.loads  # orjson.JSONDecodeError subclasses json.JSONDecodeError
+except ImportError:
+    json_loads = json.loads
+
+# Use moderate headers - enough to bypass most blocks, but not so many as to trigger bot detection
+_DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.5"
+}
+
+# Shared HTTP session: keep-alive connections are reused across requests to the same host
+# (e.g. the 7 month pages of one calendar), saving a TCP + TLS handshake per request.
+_SESSION = requests.Session()
+_SESSION.headers.update(_DEFAULT_HEADERS)
+_adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32,
+                       max_retries=Retry(total=2, backoff_factor=0.3))
+_SESSION.mount("http://", _adapter)
+_SESSION.mount("https://", _adapter)
+
+# Upper bound on bytes read per page (decompressed)
+_MAX_PAGE_BYTES = 2_000_000
+
+# OpenAI request limits: a hung completion fails after _AI_TIMEOUT_SECONDS instead of the
+# SDK's 10 minute default; transient failures get _AI_MAX_ATTEMPTS tries with backoff in total
+# (the client's own retries are switched off per call so they don't multiply with these)
+_AI_TIMEOUT_SECONDS = 180
+_AI_MAX_ATTEMPTS = 3
+
+# Concurrent Stage 2 detail pages (fetch + AI call each); kept modest so event sites
+# and the OpenAI rate limit aren't hammered
+_STAGE2_MAX_WORKERS = 8
+
+# Precompiled patterns and lookup sets shared by the scrapers (compiled once at import)
+_MONTH_NAMES = "January|February|March|April|May|June|July|August|September|October|November|December"
+_HHMM_RE = re.compile(r'^\d{2}:\d{2}$')
+_MONTH_NAME_RE = re.compile(rf'({_MONTH_NAMES})', re.I)
+# Month number by lowercase three-letter abbreviation, for "D Mon" card dates
+_MONTH_NUMBERS = {name[:3].lower(): i for i, name in enumerate(_MONTH_NAMES.split('|'), 1)}
+_DAY_NUM_RE = re.compile(r'\b(\d{1,2})\b')
+# Leading junk stripped from generic_auto titles in one pass, in order: numbers, a date
+# prefix like "13November", then a month name (e.g. "NovemberEvent Name")
+_AUTO_TITLE_PREFIX_RE = re.compile(rf'^(?:\d+\s*)?(?:\d{{1,2}}[A-Za-z]+)?(?:{_MONTH_NAMES})?', re.I)
+# Leading junk stripped from AI event titles in one pass, in order: "5th annual ", "annual ",
+# a year like "2026 ", then a month name
+_EVENT_TITLE_PREFIX_RE = re.compile(
+    rf'^(?:\d+(?:st|nd|rd|th)\s+annual\s+)?(?:annual\s+)?(?:20\d{{2}}\s+)?(?:{_MONTH_NAMES})?', re.I)
+_ORDINAL_PREFIX_RE = re.compile(r'^\d+(st|nd|rd|th)\s', re.I)
+_WEEK_SESSION_PREFIX_RE = re.compile(r'^(week|session)\s+\d+', re.I)
+_BARE_NUM_PREFIX_RE = re.compile(r'^\d+\s+')
+_DIGIT_RE = re.compile(r'\d')
+_DIGITS_RE = re.compile(r'\d+')
+# "14-15", "14 & 15" or "14–15" day ranges on Visit Valdosta listing cards
+_DAY_RANGE_RE = re.compile(r'(\d{1,2})\s*[-–&]\s*(\d{1,2})')
+# Clock times with minutes, e.g. "7:30 PM", in Visit Valdosta card descriptions
+_CLOCK_TIME_RE = re.compile(r'(\d{1,2}):(\d{2})\s*(AM|PM|am|pm)', re.I)
+# Common AI/site typo "Galentine's" in event titles, in any casing
+_GALENTINE_RE = re.compile(r"galentine's", re.I)
+# "7:30 PM" or "7 PM" in a single scan; the minute group is optional
+_TIME_RE = re.compile(r'(?P<hour>\d{1,2})(?::(?P<minute>\d{2}))?\s*(?P<ampm>[ap])m')  # matched against lowercased text
+_MAIN_CLASS_RE = re.compile(r"main|content|body", re.I)
+_MAIN_OR_CONTENT_CLASS_RE = re.compile(r"main|content", re.I)
+_DATE_CLASS_RE = re.compile(r"date|time", re.I)
+_CONTAINER_CLASS_RE_EVENTS = re.compile(r"event|attraction|place|card|item|entry|post|listing", re.I)
+_CONTAINER_CLASS_RE_ATTRACTIONS = re.compile(r"place|card|item|entry|post|listing|location|destination|attraction|thing", re.I)
+_CONTAINER_CLASS_RE_AUTO = re.compile(r"event|attraction|place|card|item|entry|post|listing|view", re.I)
+
+# Titles that are UI elements/navigation rather than events or places (exact, lowercase)
+_JUNK_EXACT = frozenset({
+    'log in', 'sign up', 'learn more', 'read more', 'click here',
+    'menu', 'search', 'home', 'about', 'contact', 'privacy',
+    'terms', 'getting there', 'share', 'save', 'map', 'photos',
+})
+
+# Context words extract_time uses to pick a plausible default time, in priority order,
+# with the fixed time returned for each (so re-scraping the same text gives the same result).
+# Matching is by substring, so "afternoon" must come before "noon".
+_CONTEXT_TIMES = (
+    ("morning", "09:00"), ("breakfast", "09:00"), ("brunch", "09:00"),
+    ("afternoon", "14:00"), ("lunch", "12:00"), ("noon", "12:00"),
+    ("evening", "19:00"), ("dinner", "19:00"), ("night", "19:00"),
+)
+# extract_time's default when the text has neither a time nor a context word
+_DEFAULT_TIME = "10:00"
+
+# Placeholder start times for attractions (not time-specific), assigned in rotation
+_ATTRACTION_TIMES = ("09:00", "10:00", "11:00", "12:00", "13:00", "14:00", "15:00", "16:00", "17:00")
+
+# Section headings on attractions pages that are not places themselves (exact, lowercase)
+_GENERIC_HEADERS = frozenset({
+    'things to do', 'attractions', 'events', 'overview', 'about', 'places', 'restaurants',
+})
+
+# Markup dropped before page HTML goes into an AI prompt: it costs tokens but carries no
+# event details. class/id/data-* attributes stay, since they often label dates and titles.
+_NOISE_TAGS = ["script", "style", "nav", "footer", "header", "svg", "noscript", "iframe", "template"]
+_NOISE_ATTRS = frozenset({'style', 'srcset', 'sizes', 'role', 'tabindex', 'loading', 'decoding', 'width', 'height'})
+
+# Tags that can hold a listing card's title, in _card_fields
+_CARD_TITLE_TAGS = frozenset({'h2', 'h3', 'h4', 'a'})
+
+# Placeholder titles that suggest the AI failed to extract a real event name (lowercase)
+_PLACEHOLDER_TITLES = frozenset({'unknown', 'untitled', 'tbd', 'tba'})
+
+
+def _make_soup(html: str) -> BeautifulSoup:
+    """Parse HTML with the fast C-based lxml parser, falling back to html.parser if lxml is missing"""
+    try:
+        return BeautifulSoup(html, "lxml")
+    except FeatureNotFound:
+        return BeautifulSoup(html, "html.parser")
+
+
+def _get_html(url: str, timeout: int = 15, use_cache: bool = False) -> str:
+    """
+    Fetch a page's HTML over the shared session.
+    With use_cache (the category's cache setting), a copy fetched within the last hour is reused.
+    Raises requests exceptions on network/HTTP errors, like requests.get + raise_for_status.
+    """
+    if use_cache:
+        html = cache_manager.load_page_from_cache(url)
+        if html is not None:
+            return html
+
+    # Stream the body and stop at _MAX_PAGE_BYTES: the scrapers only keep 50-100k chars of
+    # extracted HTML, so multi-MB pages would just cost download and parse time.
+    # Reading resp.raw bypasses requests, so urllib3 errors are mapped back to requests ones.
+    with _SESSION.get(url, timeout=timeout, stream=True) as resp:
+        resp.raise_for_status()
+        try:
+            body = resp.raw.read(_MAX_PAGE_BYTES, decode_content=True)
+        except ReadTimeoutError as e:
+            raise requests.exceptions.ReadTimeout(e, request=resp.request)
+        except DecodeError as e:
+            raise requests.exceptions.ContentDecodingError(e, request=resp.request)
+        except ProtocolError as e:
+            raise requests.exceptions.ConnectionError(e, request=resp.request)
+        html = body.decode(resp.encoding or "utf-8", errors="replace")
+    if use_cache:
+        cache_manager.save_page_to_cache(url, html)
+    return html
+
+
+def _fetch_all(urls: List[str], timeout: int = 15, use_cache: bool = False) -> Dict[str, str]:
+    """
+    Fetch several pages concurrently over the shared session.
+    Returns {url: html} for the pages that loaded; failed URLs are logged and left out.
+    """
+    def fetch_one(page_url: str) -> str:
+        return _get_html(page_url, timeout=timeout, use_cache=use_cache)
+
+    pages = {}
+    if not urls:
+        return pages
+
+    with ThreadPoolExecutor(max_workers=min(8, len(urls))) as executor:
+        futures = {executor.submit(fetch_one, page_url): page_url for page_url in urls}
+        for future in as_completed(futures):
+            page_url = futures[future]
+            try:
+                pages[page_url] = future.result()
+            except Exception as e:
+                print(f"  Could not fetch {page_url}: {e}")
+
+    return pages
+
+
+class _TruncatedReplyError(Exception):
+    """An AI reply stopped at the output token limit, so its JSON is incomplete"""
+
+
+def _chat_completion(openai_client: OpenAI, model: str, prompt: str, system_prompt: str = "",
+                     response_format: Optional[Dict] = None, max_tokens: Optional[int] = None,
+                     use_cache: bool = False, is_valid: Optional[Callable[[str], bool]] = None) -> str:
+    """
+    Send a chat completion and return the stripped reply text.
+    system_prompt, when given, is sent as the system message ahead of the prompt.
+    response_format (e.g. _ITEMS_RESPONSE_FORMAT) is passed through to constrain the output,
+    and max_tokens, when given, caps the length of the reply.
+    With use_cache, replies are cached for 24 hours so an unchanged page is not re-extracted;
+    only replies that pass is_valid are stored, so a malformed reply is not replayed.
+    A reply cut off at the output limit raises _TruncatedReplyError.
+    Connection errors, timeouts and rate limits are retried with exponential backoff.
+    """
+    cache_prompt = f"{system_prompt}\n{prompt}" if system_prompt else prompt
+    if use_cache:
+        cached = cache_manager.load_ai_response(model, cache_prompt, response_format)
+        if cached is not None:
+            print(f"  [CACHE] Reusing AI response ({len(cached)} chars)")
+            return cached
+
+    messages = [{"role": "user", "content": prompt}]
+    if system_prompt:
+        messages.insert(0, {"role": "system", "content": system_prompt})
+
+    kwargs = {"response_format": response_format} if response_format else {}
+    if max_tokens:
+        kwargs["max_tokens"] = max_tokens
+    # This loop owns retries, so each attempt is exactly one HTTP request of bounded length
+    client = openai_client.with_options(max_retries=0, timeout=_AI_TIMEOUT_SECONDS)
+    for attempt in range(_AI_MAX_ATTEMPTS):
+        try:
+            response = client.chat.completions.create(
+                model=model,
+                messages=messages,
+                temperature=0.1,  # Lower temperature for more consistency
+                **kwargs
+            )
+            break
+        except (APIConnectionError, RateLimitError) as e:  # APITimeoutError is an APIConnectionError
+            if attempt == _AI_MAX_ATTEMPTS - 1:
+                raise
+            delay = min(2 ** attempt, 10)
+            print(f"  AI request failed ({type(e).__name__}), retrying in {delay}s")
+            time.sleep(delay)
+    choice = response.choices[0]
+    if choice.finish_reason == "length":
+        raise _TruncatedReplyError(f"reply hit the output limit after {len(choice.message.content or '')} chars")
+    raw_output = choice.message.content.strip()
+    if use_cache and is_valid and is_valid(raw_output):
+        cache_manager.save_ai_response(model, cache_prompt, raw_output, response_format)
+    return raw_output
+
+
+def _has_items(raw_output: str) -> bool:
+    """Whether an AI reply is a {"items": [...]} object with at least one item (worth caching)"""
+    try:
+        return bool(json_loads(raw_output).get("items"))
+    except (ValueError, AttributeError):
+        return False
+
+
+def _is_json_object(raw_output: str) -> bool:
+    """Whether an AI reply is a non-empty JSON object (worth caching)"""
+    try:
+        parsed = json_loads(raw_output)
+    except ValueError:
+        return False
+    return isinstance(parsed, dict) and bool(parsed)
+
+
+def _join_html(elements, char_limit: int) -> str:
+    """
+    Newline-join the HTML of elements, truncated to char_limit.
+    Stops serializing once the limit is reached instead of stringifying every element.
+    """
+    parts = []
+    total = 0
+    for element in elements:
+        if total >= char_limit:
+            break
+        part = str(element)
+        total += len(part) + (1 if parts else 0)  # + newline separator
+        parts.append(part)
+    return "\n".join(parts)[:char_limit]
+
+
+def _strip_page_noise(soup) -> None:
+    """
+    Remove _NOISE_TAGS elements, _NOISE_ATTRS, aria-* and on* attributes, and HTML comments,
+    and collapse whitespace-only text (template indentation) to a single newline, in place.
+    """
+    for element in soup(_NOISE_TAGS):
+        element.decompose()
+    for tag in soup.find_all(True):
+        noise = [attr for attr in tag.attrs
+                 if attr in _NOISE_ATTRS or attr.startswith(("on", "aria-"))]
+        for attr in noise:
+            del tag.attrs[attr]
+    for text in soup.find_all(string=True):
+        if isinstance(text, Comment):
+            text.extract()
+        elif len(text) > 1 and text.isspace():
+            text.replace_with("\n")
+
+
+def _card_fields(container):
+    """
+    The first title tag (h2/h3/h4/a), <p> and <a href> inside a listing card, found in a
+    single walk of its descendants instead of three find() calls. Missing ones are None.
+    """
+    title = desc = link = None
+    for element in container.descendants:
+        name = element.name
+        if name is None:
+            continue  # Text node
+        if title is None and name in _CARD_TITLE_TAGS:
+            title = element
+        if desc is None and name == 'p':
+            desc = element
+        if link is None and name == 'a' and element.get('href') is not None:
+            link = element
+        if title is not None and desc is not None and link is not None:
+            break
+    return title, desc, link
+
+
+def _inner_html(tag, char_limit: int) -> str:
+    """
+    Same as tag.decode_contents()[:char_limit] (the tag's HTML without its own start/end tags),
+    but stops serializing children once char_limit characters have been produced.
+    """
+    parts = []
+    total = 0
+    for child in tag.contents:
+        if total >= char_limit:
+            break
+        part = child.decode() if isinstance(child, Tag) else child.output_ready()
+        parts.append(part)
+        total += len(part)
+    return "".join(parts)[:char_limit]
+
+
+def _short_text(element, char_limit: int = 200) -> str:
+    """
+    Same as element.get_text(strip=True)[:char_limit], but stops walking the
+    element's strings once char_limit characters have been collected.
+    """
+    parts = []
+    total = 0
+    for text in element.stripped_strings:
+        parts.append(text)
+        total += len(text)
+        if total >= char_limit:
+            break
+    return "".join(parts)[:char_limit]
+
+
+def _month_urls(url: str, month_strs: List[str]) -> List[str]:
+    """Build url with its ?month=YYYY-MM query param set for each month, keeping other params"""
+    parts = urlsplit(url)
+    query = dict(parse_qsl(parts.query, keep_blank_values=True))
+    month_urls = []
+    for month_str in month_strs:
+        query["month"] = month_str
+        month_urls.append(urlunsplit(parts._replace(query=urlencode(query), fragment="")))
+    return month_urls
+
+
+# Common date layouts _parse_date tries with strptime before dateutil's much slower tokenizer,
+# picked by the string's shape so few attempts fail. Yearless ones ("March 5", "Mar 5") get
+# the current year appended first.
+_NUMERIC_DATE_FORMATS = ("%Y-%m-%d", "%m/%d/%Y")
+_MONTH_NAME_DATE_FORMATS = ("%B %d, %Y", "%b %d, %Y")
+_YEARLESS_DATE_FORMATS = ("%B %d %Y", "%b %d %Y")
+
+
+def _parse_date(date_str: str) -> Optional[datetime]:
+    """
+    Parse a date string, returning None if it can't be parsed.
+    ISO dates (the usual AI output) and other common layouts take a strptime fast path;
+    anything else goes through dateutil, with missing fields taken from today (midnight),
+    as dateutil does by default - so "7:00 PM", "15" or "Saturday" land on or near today.
+    """
+    if not date_str or not isinstance(date_str, str):
+        return None
+    return _parse_date_cached(date_str, date.today())
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_cached(date_str: str, today: date) -> Optional[datetime]:
+    """
+    _parse_date's parsing, memoized since listings repeat the same date strings.
+    today is part of the key so partial dates don't go stale from one day to the next.
+    """
+    current_year = today.year
+    if date_str[:1].isdigit():
+        fast_text, fast_formats = date_str, _NUMERIC_DATE_FORMATS
+    elif ',' in date_str:
+        fast_text, fast_formats = date_str, _MONTH_NAME_DATE_FORMATS
+    else:
+        fast_text, fast_formats = f"{date_str} {current_year}", _YEARLESS_DATE_FORMATS
+    for date_format in fast_formats:
+        try:
+            return datetime.strptime(fast_text, date_format)
+        except ValueError:
+            pass
+    try:
+        return dateparser.parse(date_str, default=datetime(today.year, today.month, today.day), fuzzy=False)
+    except (ValueError, OverflowError):  # dateutil's ParserError is a ValueError
+        return None
 
 
 def scrape_with_ai(url: str, source_type: str, openai_client: Optional[OpenAI],
-                   scraping_method: str = "ai") -> List[Dict]:
-    """Use AI to intelligently scrape any website with post-processing for consistency"""
+                   scraping_method: str = "ai", use_cache: bool = False) -> List[Dict]:
+    """
+    Use AI to intelligently scrape any website with post-processing for consistency.
+    use_cache (the category's cache setting) allows reusing pages fetched within the last hour.
+    """
     if not openai_client:
         print(f"OpenAI client not available for AI scraping {url}")
         return []
@@ -24,58 +425,54 @@ def scrape_with_ai(url: str, source_type: str, openai_client: Optional[OpenAI],
     # Two-stage scraping for problematic listing pages
     # Support all calendar-based types: events, classes, meetings
     if scraping_method == "ai_twostage" and source_type in ["events", "classes", "meetings"]:
-        return _scrape_twostage(url, openai_client, source_type)
+        return _scrape_twostage(url, openai_client, source_type, use_cache)
 
     try:
-        from dateutil.relativedelta import relativedelta
-
-        # Use moderate headers - enough to bypass most blocks, but not so many as to trigger bot detection
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.5"
-        }
-
         all_results = []
+        # Computed once per scrape and shared by the prompts and the per-item date handling
+        today = datetime.now()
+        today_str = today.strftime("%Y-%m-%d")
 
         # For calendar-based event sites, try to fetch multiple months
         # (Attractions don't need this - they're not date-specific)
         urls_to_process = [url]
+        first_html = None
         if source_type == 'events':
             # Check if this might be a calendar site by fetching and checking for tables
             try:
-                resp = requests.get(url, headers=headers, timeout=15)
-                resp.raise_for_status()
-                soup = BeautifulSoup(resp.text, "html.parser")
+                first_html = _get_html(url, use_cache=use_cache)
 
                 # If we find a calendar table, fetch multiple months
-                if soup.find("table"):
-                    current_date = datetime.now()
-                    for i in range(1, 7):  # Get next 6 months
-                        month_date = current_date + relativedelta(months=i)
-                        month_str = month_date.strftime("%Y-%m")
-                        if '?' in url:
-                            month_url = f"{url.split('?')[0]}?month={month_str}"
-                        else:
-                            month_url = f"{url}?month={month_str}"
-                        urls_to_process.append(month_url)
+                # (a raw substring scan is enough here - no need to parse the page)
+                if "<table" in first_html[:500_000].lower():
+                    month_strs = [(today + relativedelta(months=i)).strftime("%Y-%m")
+                                  for i in range(1, 7)]  # Get next 6 months
+                    urls_to_process.extend(_month_urls(url, month_strs))
                     print(f"  Detected calendar site, will process {len(urls_to_process)} months")
             except:
                 pass  # If detection fails, just process the single URL
         else:
             print(f"  Scraping attractions from single page")
 
-        # Process each URL (current month + future months if calendar site)
+        # Download the pages up front so the months load concurrently
+        # (the first page is reused from calendar detection when we already have it)
+        if first_html is not None:
+            pages = _fetch_all(urls_to_process[1:], use_cache=use_cache)
+            pages[url] = first_html
+        else:
+            pages = _fetch_all(urls_to_process, use_cache=use_cache)
+
+        # Extract the relevant HTML of each page (current month + future months if calendar site)
+        page_contents = []
         for process_url in urls_to_process:
-            try:
-                resp = requests.get(process_url, headers=headers, timeout=15)
-                resp.raise_for_status()
+            if process_url not in pages:
+                continue  # Fetch failed (already logged), skip this page
 
-                soup = BeautifulSoup(resp.text, "html.parser")
+            try:
+                soup = _make_soup(pages[process_url])
 
-                # Remove script, style, nav, footer, and header elements
-                for element in soup(["script", "style", "nav", "footer", "header"]):
-                    element.decompose()
+                # Remove script, style, nav, footer, header and svg elements and noise attributes
+                _strip_page_noise(soup)
 
                 # Extract meaningful HTML structure (not just text)
                 # Keep semantic structure: links, dates, headings, containers
@@ -83,23 +480,27 @@ def scrape_with_ai(url: str, source_type: str, openai_client: Optional[OpenAI],
                 char_limit = 100000 if source_type == 'attractions' else 50000  # More content for attractions
 
                 # Strategy 1: Find main content containers (works for most sites)
-                main_content = soup.find(["main", "article"]) or soup.find("div", class_=re.compile(r"main|content|body", re.I))
+                main_content = soup.find(["main", "article"]) or soup.find("div", class_=_MAIN_CLASS_RE)
                 use_simplified = False
 
                 if main_content:
+                    # Serialize the container once and reuse it for the size checks and the slice
+                    main_html = str(main_content)
+                    main_len = len(main_html)
+
                     # If main container is too small, it's probably empty (JS-rendered content)
-                    if len(str(main_content)) < 1000:
-                        print(f"  HTML extraction: Main container too small ({len(str(main_content))} chars), trying other strategies")
+                    if main_len < 1000:
+                        print(f"  HTML extraction: Main container too small ({main_len} chars), trying other strategies")
                         main_content = None  # Force fallback to other strategies
                     elif source_type == 'attractions':
                         # For attractions, always use simplified extraction (not raw HTML)
-                        print(f"  HTML extraction: Found main container ({len(str(main_content))} chars), will simplify for attractions")
-                        # Replace soup with main_content for searching
-                        soup = BeautifulSoup(str(main_content), "html.parser")
+                        print(f"  HTML extraction: Found main container ({main_len} chars), will simplify for attractions")
+                        # Search within main_content directly (no need to re-parse it)
+                        soup = main_content
                         use_simplified = True
                         main_content = None  # Force to use simplified extraction below
                     else:
-                        content_html = str(main_content)[:char_limit]
+                        content_html = main_html[:char_limit]
                         print(f"  HTML extraction: Using main/article container ({len(content_html)} chars)")
 
                 if not main_content or use_simplified:
@@ -107,55 +508,53 @@ def scrape_with_ai(url: str, source_type: str, openai_client: Optional[OpenAI],
                     # For attractions, be more aggressive in finding content
                     if source_type == 'attractions':
                         containers = soup.find_all(["article", "div", "li", "section", "h2", "h3"],
-                                                   class_=re.compile(r"place|card|item|entry|post|listing|location|destination|attraction|thing", re.I),
+                                                   class_=_CONTAINER_CLASS_RE_ATTRACTIONS,
                                                    limit=200)  # More items for attractions
                     else:
                         containers = soup.find_all(["article", "div", "li", "section"],
-                                                   class_=re.compile(r"event|attraction|place|card|item|entry|post|listing", re.I),
+                                                   class_=_CONTAINER_CLASS_RE_EVENTS,
                                                    limit=100)
 
                     if containers:
                         # For attractions, simplify HTML to make it easier for AI to parse
                         if source_type == 'attractions':
-                            simplified_items = []
+                            simplified_items = []  # (title, description, url) tuples
+                            seen_titles = set()  # casefolded, so "Museum" and "MUSEUM" count once
 
                             # Strategy A: Extract from containers
-                            for idx, container in enumerate(containers[:200], 1):
-                                title = container.find(['h2', 'h3', 'h4', 'a'])
+                            for container in containers[:200]:
+                                title, desc, link = _card_fields(container)
                                 title_text = title.get_text(strip=True) if title else ""
-
-                                desc = container.find('p')
-                                desc_text = desc.get_text(strip=True)[:200] if desc else ""
-
-                                link = container.find('a', href=True)
+                                desc_text = _short_text(desc) if desc else ""
                                 link_url = link['href'] if link else ""
 
                                 if title_text and len(title_text) > 3:
-                                    simplified_items.append(f"ITEM {idx}:\nTitle: {title_text}\nDescription: {desc_text}\nURL: {link_url}\n")
+                                    simplified_items.append((title_text, desc_text, link_url))
+                                    seen_titles.add(title_text.casefold())
 
                             # Strategy B: Also find all h2/h3/h4 headers directly (like article-style fallback)
                             # This catches items that aren't in proper containers
-                            headers = soup.find_all(['h2', 'h3', 'h4'], limit=200)
-                            seen_titles = {item.split('\n')[1].replace('Title: ', '') for item in simplified_items}
+                            headers = soup.select("h2, h3, h4", limit=200)
 
                             for header in headers:
                                 title_text = header.get_text(strip=True)
+                                title_key = title_text.casefold()
 
                                 # Skip if already found or too short (match generic_auto threshold)
-                                if len(title_text) < 3 or title_text in seen_titles:
+                                if len(title_text) < 3 or title_key in seen_titles:
                                     continue
 
                                 # Skip generic section headers
-                                if title_text.lower() in ['things to do', 'attractions', 'events', 'overview', 'about', 'places', 'restaurants']:
+                                if title_key in _GENERIC_HEADERS:
                                     continue
 
-                                seen_titles.add(title_text)
+                                seen_titles.add(title_key)
 
                                 # Find description in following paragraph
                                 desc_text = ""
                                 next_elem = header.find_next_sibling(['p', 'div'])
                                 if next_elem:
-                                    desc_text = next_elem.get_text(strip=True)[:200]
+                                    desc_text = _short_text(next_elem)
 
                                 # Find link
                                 link = header.find('a') or (next_elem.find('a') if next_elem else None)
@@ -165,12 +564,16 @@ def scrape_with_ai(url: str, source_type: str, openai_client: Optional[OpenAI],
                                 if link_url and '/article/' in link_url:
                                     continue
 
-                                simplified_items.append(f"ITEM {len(simplified_items)+1}:\nTitle: {title_text}\nDescription: {desc_text}\nURL: {link_url}\n")
+                                simplified_items.append((title_text, desc_text, link_url))
 
-                            content_html = "\n".join(simplified_items)[:char_limit]
+                            # Format the items once, numbered in order
+                            content_html = "\n".join(
+                                f"ITEM {idx}:\nTitle: {title_text}\nDescription: {desc_text}\nURL: {link_url}\n"
+                                for idx, (title_text, desc_text, link_url) in enumerate(simplified_items, 1)
+                            )[:char_limit]
                             print(f"  HTML extraction: Found {len(simplified_items)} items from containers + headers ({len(content_html)} chars)")
                         else:
-                            content_html = "\n".join([str(c) for c in containers])[:char_limit]
+                            content_html = _join_html(containers, char_limit)
                             print(f"  HTML extraction: Using {len(containers)} containers ({len(content_html)} chars)")
                     else:
                         # Strategy 3: If there's a table (calendar site), get it with context
@@ -182,75 +585,71 @@ def scrape_with_ai(url: str, source_type: str, openai_client: Optional[OpenAI],
                             print(f"  HTML extraction: Using table with context ({len(content_html)} chars)")
                         else:
                             # Fallback: Get body content
-                            content_html = str(soup.body)[:char_limit] if soup.body else str(soup)[:char_limit]
+                            content_html = _inner_html(soup.body or soup, char_limit)
                             print(f"  HTML extraction: Using body fallback ({len(content_html)} chars)")
 
-                # Use AI to extract events/classes/meetings/attractions
-                current_year = datetime.now().year
-                current_month = datetime.now().month
-
-                # Create source-type specific prompts using helper functions
-                if source_type == 'events':
-                    prompt = _generate_events_prompt(content_html, current_year)
-                elif source_type == 'classes':
-                    prompt = _generate_classes_prompt(content_html, current_year)
-                elif source_type == 'meetings':
-                    prompt = _generate_meetings_prompt(content_html, current_year)
-                else:  # attractions
-                    prompt = f"""
-Extract ALL attractions from the structured list below. Each ITEM represents one place/attraction.
-
-RULES:
-1. Extract EVERY item in the list
-2. Skip ONLY if the title is a generic category (1-2 words like "Food", "Museums") - but include specific places even if short
-3. Use the Title, Description, and URL exactly as provided
-4. Add date "{datetime.now().strftime("%Y-%m-%d")}" and time "10:00" to all items
-
-INPUT FORMAT - Each item looks like this:
-ITEM X:
-Title: [Place Name]
-Description: [Description text]
-URL: [URL path]
-
-YOUR TASK:
-Convert each ITEM into JSON format. If you see 50 items, return 50 JSON objects.
-
-Return ONLY a JSON array (no markdown, no extra text):
-[
-  {{"title": "Title from item", "date": "{datetime.now().strftime("%Y-%m-%d")}", "time": "10:00", "description": "Description from item", "url": "URL from item"}},
-  ...
-]
+                page_contents.append((process_url, content_html))
 
-ITEMS:
-{content_html}
-"""
-
-                # Use more powerful model for attractions (complex HTML structures)
-                model = "gpt-4o" if source_type == 'attractions' else "gpt-4o-mini"
-
-                response = openai_client.chat.completions.create(
-                    model=model,
-                    messages=[{"role": "user", "content": prompt}],
-                    temperature=0.1  # Lower temperature for more consistency
-                )
-
-                if source_type == 'attractions':
-                    print(f"  Using {model} model for better extraction")
+            except Exception as e:
+                print(f"  Error processing {process_url}: {e}")
+                continue
 
-                raw_output = response.choices[0].message.content.strip()
+        # Calendar months: send all pages in one request when they fit, so the instructions
+        # and the OpenAI round trip are paid once instead of once per month
+        separate_pages = None  # The per-page contents, kept while a combined request is tried
+        if len(page_contents) > 1:
+            combined_html = _PAGE_BREAK.join(content_html for _, content_html in page_contents)
+            if len(combined_html) <= _COMBINED_CONTENT_CHAR_LIMIT:
+                print(f"  Combining {len(page_contents)} pages into one AI request ({len(combined_html)} chars)")
+                separate_pages = page_contents
+                page_contents = [(url, combined_html)]
+            else:
+                print(f"  Combined pages too large ({len(combined_html)} chars), using one AI request per page")
+
+        # Static instructions go in the system message; page content in the user message
+        def build_prompts(contents):
+            return [(process_url, _generate_page_prompt(content_html, source_type, today),
+                     _max_output_tokens(content_html, source_type))
+                    for process_url, content_html in contents]
+
+        page_prompts = build_prompts(page_contents)
+
+        # Attractions use schema-constrained output, so the smaller model returns valid JSON reliably;
+        # the other types use JSON mode. Either way the reply is a {"items": [...]} object.
+        model = "gpt-4o-mini"
+        if source_type == 'attractions':
+            response_format = _ITEMS_RESPONSE_FORMAT
+            print(f"  Using {model} with structured output for attractions")
+        else:
+            response_format = _JSON_OBJECT_RESPONSE_FORMAT
 
-                # Clean JSON markers
-                if raw_output.startswith("```json"):
-                    raw_output = raw_output[7:]
-                if raw_output.startswith("```"):
-                    raw_output = raw_output[3:]
-                if raw_output.endswith("```"):
-                    raw_output = raw_output[:-3]
-                raw_output = raw_output.strip()
+        # Run the AI extraction for all pages concurrently - each call is mostly network wait
+        def run_prompts(prompts):
+            if not prompts:
+                return []
+            with ThreadPoolExecutor(max_workers=min(7, len(prompts))) as executor:
+                return [executor.submit(_chat_completion, openai_client, model, prompt,
+                                        _PAGE_INSTRUCTIONS.get(source_type, _ATTRACTIONS_INSTRUCTIONS),
+                                        response_format, max_tokens, use_cache, _has_items)
+                        for _, prompt, max_tokens in prompts]
+
+        futures = run_prompts(page_prompts)
+
+        # A busy calendar can outgrow one reply (or the request can fail outright); rather than
+        # lose every month, redo the pages with one request each
+        if separate_pages and futures[0].exception() is not None:
+            print(f"  Combined request failed ({futures[0].exception()}), retrying with one AI request per page")
+            page_prompts = build_prompts(separate_pages)
+            futures = run_prompts(page_prompts)
+
+        # Parse the responses in page order
+        for (process_url, _, _), future in zip(page_prompts, futures):
+            try:
+                raw_output = future.result()
 
-                # Parse JSON
+                # Parse JSON (structured output / JSON mode replies are plain JSON, no markdown fences)
                 try:
-                    items = json.loads(raw_output)
+                    items = json_loads(raw_output).get("items", [])
                     print(f"  AI extracted {len(items)} items from {process_url}")
                     if items:
                         print(f"  Sample item: {items[0]}")
@@ -261,7 +660,7 @@ ITEMS:
 
                 # Process each item with post-processing
                 for item in items:
-                    date_str = item.get('date', datetime.now().strftime("%Y-%m-%d"))
+                    date_str = item.get('date', today_str)
                     time_str = item.get('time', '')
                     title = item.get('title', 'Untitled')
                     item_url = item.get('url', url)
@@ -274,39 +673,28 @@ ITEMS:
                     if source_type == 'events':
                         # Smart year handling for events
                         try:
-                            parsed_date = dateparser.parse(date_str)
+                            parsed_date = _parse_date(date_str)
                             if parsed_date:
-                                current_date = datetime.now()
-
                                 # Smart year bumping based on month difference
                                 # If the event month is more than 2 months in the past, assume next year
                                 # This handles: Nov viewing Jan/Feb/Mar → next year
-                                # But keeps: Nov viewing Oct/Nov → current year (recent past events)
-                                months_diff = (current_date.year - parsed_date.year) * 12 + (current_date.month - parsed_date.month)
-
-                                if months_diff > 2:
-                                    # Event is from 3+ months ago, assume it's for next year
+                                # But keeps: Nov viewing Oct/Nov → current year (recent past events,
+                                # filtered out later) and future months as-is
+                                if (today.year - parsed_date.year) * 12 + (today.month - parsed_date.month) > 2:
                                     parsed_date = parsed_date.replace(year=parsed_date.year + 1)
-                                elif months_diff < 0:
-                                    # Event is in a future month of current year, keep as-is
-                                    pass
-                                elif months_diff <= 2 and parsed_date.date() < current_date.date():
-                                    # Event is in current or recent past month and date has passed
-                                    # Keep as current year (will be filtered as past event)
-                                    pass
 
                                 date_str = parsed_date.strftime("%Y-%m-%d")
                             else:
                                 # If parsing fails, use today's date as fallback
-                                date_str = datetime.now().strftime("%Y-%m-%d")
-                        except:
-                            date_str = datetime.now().strftime("%Y-%m-%d")
+                                date_str = today_str
+                        except ValueError:  # e.g. Feb 29 bumped into a non-leap year
+                            date_str = today_str
                     else:
                         # For attractions, always use today's date (they're not time-specific)
-                        date_str = datetime.now().strftime("%Y-%m-%d")
+                        date_str = today_str
 
                     # Validate and fix time format; keep empty string as-is (no confirmed time)
-                    if time_str and not re.match(r'^\d{2}:\d{2}$', time_str):
+                    if time_str and not _HHMM_RE.match(time_str):
                         time_str = ''
 
                     all_day = not time_str
@@ -335,43 +723,36 @@ ITEMS:
         return []
 
 
-def _generate_events_prompt(content_html: str, current_year: int) -> str:
-    """Generate AI prompt specifically for events extraction"""
-    return f"""
-You are an expert web scraper. Extract EVENTS information from the following HTML content.
+# Static extraction instructions for single-page AI scraping (scrape_with_ai), sent as the
+# system message. The dynamic part (today's date, year, page content) goes in the user
+# message built by _generate_page_prompt().
+_EVENTS_INSTRUCTIONS = """
+You are an expert web scraper. Extract EVENTS information from the HTML content provided by the user.
+The user message starts with TODAY'S DATE and CURRENT YEAR, followed by the HTML content.
 
-TODAY'S DATE: {datetime.now().strftime("%Y-%m-%d")}
-CURRENT YEAR: {current_year}
+The HTML content may span several calendar months, separated by "=== PAGE BREAK ===" lines - extract the events from ALL of them into one "items" list.
 
 IMPORTANT INSTRUCTIONS:
 1. Extract ALL events you can find, not just a few examples - INCLUDE ALL calendar entries
-2. For dates: Use YYYY-MM-DD format. The current year is {current_year}. For dates without a year, assume {current_year}. If a date (like "November 13") has already passed in {current_year}, assume it's for the NEXT year ({current_year + 1}).
+2. For dates: Use YYYY-MM-DD format. For dates without a year, assume the CURRENT YEAR. If a date (like "November 13") has already passed in the CURRENT YEAR, assume it's for the NEXT year (CURRENT YEAR + 1).
 3. For times: Use HH:MM 24-hour format. Look for times in the content. If no time found, use "" (empty string)
 4. For URLs: Extract href attributes from <a> tags. Return relative URLs as-is (e.g., "/event/123")
 5. For titles: Extract the event name exactly as shown - keep all calendar entries
 6. EXCLUDE ONLY: Navigation items and UI elements like "Log In", "Sign Up", "Read More", "Menu", "Search", "Home", "About", "Contact"
 7. For descriptions: Extract from paragraph text, keep it under 200 characters
 
-Return ONLY a valid JSON array with no markdown formatting or additional text. Format:
-[
-  {{"title": "Event Name", "date": "{current_year}-01-15", "time": "19:00", "description": "Brief description", "url": "/event/123"}},
-  {{"title": "Another Event", "date": "{current_year}-02-20", "time": "14:00", "description": "Another description", "url": "/event/456"}}
-]
+Return a JSON object of this form (example dates shown as YYYY-MM-DD):
+{"items": [
+  {"title": "Event Name", "date": "YYYY-01-15", "time": "19:00", "description": "Brief description", "url": "/event/123"},
+  {"title": "Another Event", "date": "YYYY-02-20", "time": "14:00", "description": "Another description", "url": "/event/456"}
+]}
 
-If you cannot find any events, return an empty array: []
-
-HTML content:
-{content_html}
+If you cannot find any events, return an empty list: {"items": []}
 """
 
-
-def _generate_classes_prompt(content_html: str, current_year: int) -> str:
-    """Generate AI prompt specifically for classes extraction"""
-    return f"""
-You are an expert web scraper. Extract CLASS/WORKSHOP information from the following HTML content.
-
-TODAY'S DATE: {datetime.now().strftime("%Y-%m-%d")}
-CURRENT YEAR: {current_year}
+_CLASSES_INSTRUCTIONS = """
+You are an expert web scraper. Extract CLASS/WORKSHOP information from the HTML content provided by the user.
+The user message starts with TODAY'S DATE and CURRENT YEAR, followed by the HTML content.
 
 CLASSES-SPECIFIC INSTRUCTIONS:
 1. Extract ALL classes/workshops you can find
@@ -384,48 +765,165 @@ CLASSES-SPECIFIC INSTRUCTIONS:
 8. IMPORTANT: Keep ordinals like "2nd Week", "Week 3" - these are meaningful for classes
 9. Look for recurring schedules: "Every Monday", "Wednesdays 2-4pm", "Monthly workshop"
 
-Return ONLY a valid JSON array with no markdown formatting. Format:
-[
-  {{"title": "Class Name with Instructor", "date": "{current_year}-02-15", "time": "14:00", "description": "Detailed class description with instructor, skill level, what you'll learn", "url": "/class/123", "instructor": "Instructor Name", "skill_level": "beginner"}}
-]
+Return a JSON object of this form (example date shown as YYYY-MM-DD):
+{"items": [
+  {"title": "Class Name with Instructor", "date": "YYYY-02-15", "time": "14:00", "description": "Detailed class description with instructor, skill level, what you'll learn", "url": "/class/123", "instructor": "Instructor Name", "skill_level": "beginner"}
+]}
 
-If you cannot find any classes, return an empty array: []
-
-HTML content:
-{content_html}
+If you cannot find any classes, return an empty list: {"items": []}
 """
 
-
-def _generate_meetings_prompt(content_html: str, current_year: int) -> str:
-    """Generate AI prompt specifically for meetings extraction"""
-    return f"""
-You are an expert web scraper. Extract MEETING information from the following HTML content.
-
-TODAY'S DATE: {datetime.now().strftime("%Y-%m-%d")}
-CURRENT YEAR: {current_year}
+_MEETINGS_INSTRUCTIONS = """
+You are an expert web scraper. Extract MEETING information from the HTML content provided by the user.
+The user message starts with TODAY'S DATE and CURRENT YEAR, followed by the HTML content.
 
 MEETINGS-SPECIFIC INSTRUCTIONS:
 1. Extract ALL meetings you can find with their EXACT scheduled dates
 2. For titles: Use exact meeting names - be precise (e.g., "City Council Meeting", "Board of Directors Meeting")
 3. For locations: Extract meeting location/venue (e.g., "City Hall Room 203")
-4. For dates: Use YYYY-MM-DD format. Current year is {current_year}
+4. For dates: Use YYYY-MM-DD format. Dates without a year are in the CURRENT YEAR
 5. For times: Use HH:MM 24-hour format. Meetings often have exact start times - extract them precisely. Use "" (empty string) if no time is found.
 6. For descriptions: Include agenda items, attendees, purpose of meeting (200 chars)
 7. IMPORTANT: Extract ONLY the specific meeting dates shown on the page - do NOT infer or generate recurring patterns
 8. IMPORTANT: Keep year prefixes if present (e.g., "2026 Annual Meeting")
 
-Return ONLY a valid JSON array with no markdown formatting. Format:
-[
-  {{"title": "Meeting Name", "date": "{current_year}-02-15", "time": "18:00", "description": "Meeting purpose and agenda", "url": "/meeting/123", "location": "Meeting Location", "recurring_pattern": ""}}
-]
+Return a JSON object of this form (example date shown as YYYY-MM-DD):
+{"items": [
+  {"title": "Meeting Name", "date": "YYYY-02-15", "time": "18:00", "description": "Meeting purpose and agenda", "url": "/meeting/123", "location": "Meeting Location", "recurring_pattern": ""}
+]}
 (Use "" for time if no time is found on the page.)
 
-If you cannot find any meetings, return an empty array: []
+If you cannot find any meetings, return an empty list: {"items": []}
+"""
 
-HTML content:
-{content_html}
+_ATTRACTIONS_INSTRUCTIONS = """
+Extract ALL attractions from the structured list provided by the user. Each ITEM represents one place/attraction.
+The user message starts with TODAY'S DATE, followed by the ITEMS.
+
+RULES:
+1. Extract EVERY item in the list
+2. Skip ONLY if the title is a generic category (1-2 words like "Food", "Museums") - but include specific places even if short
+3. Use the Title, Description, and URL exactly as provided
+4. Use TODAY'S DATE as the date and "10:00" as the time for all items
+
+INPUT FORMAT - Each item looks like this:
+ITEM X:
+Title: [Place Name]
+Description: [Description text]
+URL: [URL path]
+
+YOUR TASK:
+Convert each ITEM into a JSON object in the "items" list. If you see 50 items, return 50 JSON objects.
+
+Return a JSON object of this form:
+{"items": [
+  {"title": "Title from item", "date": "TODAY'S DATE", "time": "10:00", "description": "Description from item", "url": "URL from item"},
+  ...
+]}
 """
 
+# Strict JSON schema for attractions replies; structured outputs need an object at the root
+_ITEMS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "items": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "title": {"type": "string"},
+                    "date": {"type": "string"},
+                    "time": {"type": "string"},
+                    "description": {"type": "string"},
+                    "url": {"type": "string"},
+                },
+                "required": ["title", "date", "time", "description", "url"],
+                "additionalProperties": False,
+            },
+        },
+    },
+    "required": ["items"],
+    "additionalProperties": False,
+}
+
+_ITEMS_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {"name": "items", "schema": _ITEMS_SCHEMA, "strict": True},
+}
+
+# JSON mode for events/classes/meetings, whose items carry type-specific extra fields;
+# the reply is always a bare {"items": [...]} object, never fenced or padded with prose
+_JSON_OBJECT_RESPONSE_FORMAT = {"type": "json_object"}
+
+# Strict JSON schema for two-stage Stage 1 replies (one entry per listed event/class/meeting)
+_STAGE1_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "items": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "title": {"type": "string"},
+                    "url": {"type": "string"},
+                    "date": {"type": "string"},
+                    "time": {"type": "string"},
+                    "recurring_pattern": {"type": "string"},
+                },
+                "required": ["title", "url", "date", "time", "recurring_pattern"],
+                "additionalProperties": False,
+            },
+        },
+    },
+    "required": ["items"],
+    "additionalProperties": False,
+}
+
+_STAGE1_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {"name": "stage1_items", "schema": _STAGE1_SCHEMA, "strict": True},
+}
+
+# Output budget for attractions replies: room for one JSON object per ITEM, up to
+# gpt-4o-mini's output limit, so a runaway reply can't run long
+_TOKENS_PER_ITEM = 200
+_MAX_OUTPUT_TOKENS = 16000
+
+# Separator between calendar month pages combined into one events request
+_PAGE_BREAK = "\n\n=== PAGE BREAK ===\n\n"
+
+# Upper bound for combined month HTML. Markup runs ~2.5-3 chars per token, so this is at most
+# ~60k tokens, leaving gpt-4o-mini's 128k context room for the instructions and the reply;
+# larger calendars fall back to one request per page
+_COMBINED_CONTENT_CHAR_LIMIT = 150_000
+
+_PAGE_INSTRUCTIONS = {
+    'events': _EVENTS_INSTRUCTIONS,
+    'classes': _CLASSES_INSTRUCTIONS,
+    'meetings': _MEETINGS_INSTRUCTIONS,
+    'attractions': _ATTRACTIONS_INSTRUCTIONS,
+}
+
+
+def _max_output_tokens(content_html: str, source_type: str) -> Optional[int]:
+    """Reply cap for a simplified attractions ITEM list; None (no cap) for everything else"""
+    if source_type != 'attractions':
+        return None
+    item_count = content_html.count("\nTitle: ")
+    return min(_MAX_OUTPUT_TOKENS, _TOKENS_PER_ITEM * item_count) if item_count else None
+
+
+def _generate_page_prompt(content_html: str, source_type: str, today: datetime) -> str:
+    """Generate the dynamic user message that follows the static _PAGE_INSTRUCTIONS"""
+    if source_type == 'attractions':
+        return f"TODAY'S DATE: {today.strftime('%Y-%m-%d')}\n\nITEMS:\n{content_html}"
+
+    return f"""TODAY'S DATE: {today.strftime("%Y-%m-%d")}
+CURRENT YEAR: {today.year}
+
+HTML content:
+{content_html}"""
+
 
 def _truncate_description(desc: str, max_length: int = 150) -> str:
     """
@@ -448,20 +946,17 @@ def _truncate_description(desc: str, max_length: int = 150) -> str:
         return truncated + '...'
 
 
-def _generate_stage2_events_prompt(event_title: str, event_content: str, listing_date: str, today: datetime, six_months_later: datetime) -> str:
-    """Generate Stage 2 AI prompt specifically for events"""
-    date_hint = f"\nIMPORTANT: The listing page showed this event on {listing_date}. This is likely the correct date." if listing_date else ""
-
-    return f"""
+# Stage 2 prompt for one events details page, filled in by _generate_stage2_events_prompt()
+_STAGE2_EVENTS_PROMPT_TEMPLATE = """
 Extract ACCURATE date and schedule information from this event details page.
 
-Item Title: {event_title}{date_hint}
-Today's Date: {today.strftime("%Y-%m-%d")} ({today.strftime("%A, %B %d, %Y")})
-Extract dates through: {six_months_later.strftime("%Y-%m-%d")} (next 6 months)
+Item Title: {title}{date_hint}
+Today's Date: {today} ({today_long})
+Extract dates through: {through} (next 6 months)
 
-CRITICAL: If this page lists MULTIPLE events or dates, focus on finding the date for "{event_title}" specifically.
+CRITICAL: If this page lists MULTIPLE events or dates, focus on finding the date for "{title}" specifically.
 - If the page shows other events with different dates, ignore those dates
-- Look for the date that matches the event title "{event_title}"
+- Look for the date that matches the event title "{title}"
 - Only extract dates that clearly belong to this specific event
 
 INSTRUCTIONS:
@@ -502,20 +997,31 @@ Return ONLY valid JSON:
 }}
 
 HTML content:
-{event_content}
+{content}
 """
 
 
-def _generate_stage2_classes_prompt(class_title: str, class_content: str, listing_date: str, today: datetime, six_months_later: datetime) -> str:
-    """Generate Stage 2 AI prompt specifically for classes"""
-    date_hint = f"\nIMPORTANT: The listing page showed this class starting on {listing_date}." if listing_date else ""
+def _generate_stage2_events_prompt(event_title: str, event_content: str, listing_date: str, today: datetime, six_months_later: datetime) -> str:
+    """Generate Stage 2 AI prompt specifically for events"""
+    date_hint = f"\nIMPORTANT: The listing page showed this event on {listing_date}. This is likely the correct date." if listing_date else ""
 
-    return f"""
+    return _STAGE2_EVENTS_PROMPT_TEMPLATE.format_map({
+        "title": event_title,
+        "date_hint": date_hint,
+        "today": today.strftime("%Y-%m-%d"),
+        "today_long": today.strftime("%A, %B %d, %Y"),
+        "through": six_months_later.strftime("%Y-%m-%d"),
+        "content": event_content,
+    })
+
+
+# Stage 2 prompt for one classes details page, filled in by _generate_stage2_classes_prompt()
+_STAGE2_CLASSES_PROMPT_TEMPLATE = """
 Extract ACCURATE schedule and class information from this class/workshop details page.
 
-Category: {class_title}{date_hint}
-Today's Date: {today.strftime("%Y-%m-%d")}
-Extract dates through: {six_months_later.strftime("%Y-%m-%d")} (next 6 months)
+Category: {title}{date_hint}
+Today's Date: {today}
+Extract dates through: {through} (next 6 months)
 
 IMPORTANT PAGE STRUCTURE:
 - This page may contain a CATEGORY heading (e.g., "DRAWING | MIXED MEDIA | 2D" or "ACTIVE ARTS")
@@ -632,20 +1138,30 @@ Return ONLY valid JSON:
 IF YOU GENERATE DATES FOR MULTIPLE MONTHS, YOU ARE DOING IT WRONG!
 
 HTML content:
-{class_content}
+{content}
 """
 
 
-def _generate_stage2_meetings_prompt(meeting_title: str, meeting_content: str, listing_date: str, today: datetime, six_months_later: datetime) -> str:
-    """Generate Stage 2 AI prompt specifically for meetings"""
-    date_hint = f"\nIMPORTANT: The listing page showed this meeting on {listing_date}." if listing_date else ""
+def _generate_stage2_classes_prompt(class_title: str, class_content: str, listing_date: str, today: datetime, six_months_later: datetime) -> str:
+    """Generate Stage 2 AI prompt specifically for classes"""
+    date_hint = f"\nIMPORTANT: The listing page showed this class starting on {listing_date}." if listing_date else ""
 
-    return f"""
+    return _STAGE2_CLASSES_PROMPT_TEMPLATE.format_map({
+        "title": class_title,
+        "date_hint": date_hint,
+        "today": today.strftime("%Y-%m-%d"),
+        "through": six_months_later.strftime("%Y-%m-%d"),
+        "content": class_content,
+    })
+
+
+# Stage 2 prompt for one meetings details page, filled in by _generate_stage2_meetings_prompt()
+_STAGE2_MEETINGS_PROMPT_TEMPLATE = """
 Extract ACCURATE date and meeting information from this meeting details page.
 
-Meeting Title: {meeting_title}{date_hint}
-Today's Date: {today.strftime("%Y-%m-%d")}
-Extract dates through: {six_months_later.strftime("%Y-%m-%d")} (next 6 months)
+Meeting Title: {title}{date_hint}
+Today's Date: {today}
+Extract dates through: {through} (next 6 months)
 
 MEETINGS-SPECIFIC INSTRUCTIONS:
 
@@ -682,10 +1198,23 @@ Return ONLY valid JSON:
 (Use "" for time if no time is found on the page.)
 
 HTML content:
-{meeting_content}
+{content}
 """
 
 
+def _generate_stage2_meetings_prompt(meeting_title: str, meeting_content: str, listing_date: str, today: datetime, six_months_later: datetime) -> str:
+    """Generate Stage 2 AI prompt specifically for meetings"""
+    date_hint = f"\nIMPORTANT: The listing page showed this meeting on {listing_date}." if listing_date else ""
+
+    return _STAGE2_MEETINGS_PROMPT_TEMPLATE.format_map({
+        "title": meeting_title,
+        "date_hint": date_hint,
+        "today": today.strftime("%Y-%m-%d"),
+        "through": six_months_later.strftime("%Y-%m-%d"),
+        "content": meeting_content,
+    })
+
+
 def _scrape_turner_center_api(url: str, source_type: str = "classes") -> List[Dict]:
     """
     Scrape Turner Center classes or events using their REST API.
@@ -694,10 +1223,6 @@ def _scrape_turner_center_api(url: str, source_type: str = "classes") -> List[Di
     For classes: Fetches only items in the "classes" category
     For events: Fetches all items EXCEPT those in the "classes" category
     """
-    from dateutil.relativedelta import relativedelta
-    from bs4 import BeautifulSoup
-    import html
-
     print(f"[Turner API] Scraping Turner Center {source_type} from REST API")
 
     # Calculate date range: yesterday to 6 months from now (buffer for UTC offset on server)
@@ -733,7 +1258,8 @@ def _scrape_turner_center_api(url: str, source_type: str = "classes") -> List[Di
             if source_type == 'classes':
                 params['categories'] = 'classes'
 
-            resp = requests.get(api_url, params=params, headers=headers, timeout=15)
+            # Pages share the session's keep-alive connection instead of a new TLS handshake each
+            resp = _SESSION.get(api_url, params=params, headers=headers, timeout=15)
             resp.raise_for_status()
 
             data = resp.json()
@@ -767,7 +1293,7 @@ def _scrape_turner_center_api(url: str, source_type: str = "classes") -> List[Di
                 # Parse description to extract clean text
                 description_html = event.get('description', '')
                 if description_html:
-                    soup = BeautifulSoup(description_html, 'html.parser')
+                    soup = _make_soup(description_html)
                     description = soup.get_text(separator=' ', strip=True)[:200]
                 else:
                     description = event.get('excerpt', '')[:200]
@@ -817,14 +1343,13 @@ def _scrape_turner_center_api(url: str, source_type: str = "classes") -> List[Di
         return []
 
 
-def _scrape_twostage(url: str, openai_client: OpenAI, source_type: str = "events") -> List[Dict]:
+def _scrape_twostage(url: str, openai_client: OpenAI, source_type: str = "events",
+                     use_cache: bool = False) -> List[Dict]:
     """
     Two-stage scraping for event listing pages with unreliable dates.
     Stage 1: Extract event titles and external URLs from listing page
     Stage 2: Scrape each external URL for accurate date information
     """
-    import time
-
     # SPECIAL HANDLING: Turner Center uses a REST API for events
     # Use the API directly instead of scraping HTML
     if 'turnercenter.org' in url and source_type in ['classes', 'events']:
@@ -845,32 +1370,26 @@ def _scrape_twostage(url: str, openai_client: OpenAI, source_type: str = "events
         print(f"[Two-Stage] Stage 1: Extracting events from listing page (using AI)")
 
     try:
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.5"
-        }
-
-        resp = requests.get(url, headers=headers, timeout=15)
-        resp.raise_for_status()
-        soup = BeautifulSoup(resp.text, "html.parser")
+        # Pages come over the shared keep-alive _SESSION, which sends _DEFAULT_HEADERS
+        soup = _make_soup(_get_html(url, use_cache=use_cache))
 
         event_urls = []
-        current_year = datetime.now().year
+        # Read the clock once for the month URLs, prompts and date checks below
+        now = datetime.now()
+        current_year = now.year
+        today_date = now.date()
+        today_str = now.strftime("%Y-%m-%d")
 
         # For calendar-based sites, handle date range parameters
         urls_to_process = [url]
 
         # Check if URL has startDate/endDate parameters (e.g., Lowndes County)
         if 'startDate=' in url and 'enddate=' in url:
-            from dateutil.relativedelta import relativedelta
-            from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
-
             # Parse URL and update date parameters
             parsed = urlparse(url)
             params = parse_qs(parsed.query)
 
-            current_date = datetime.now()
+            current_date = now
             end_date = current_date + relativedelta(months=6)
 
             # Update parameters with 6-month range
@@ -884,45 +1403,37 @@ def _scrape_twostage(url: str, openai_client: OpenAI, source_type: str = "events
             print(f"[Two-Stage] Detected date range calendar, fetching {current_date.strftime('%m/%d/%Y')} to {end_date.strftime('%m/%d/%Y')}")
 
             # Re-fetch with date range
-            resp = requests.get(updated_url, headers=headers, timeout=15)
-            resp.raise_for_status()
-            soup = BeautifulSoup(resp.text, "html.parser")
+            soup = _make_soup(_get_html(updated_url, use_cache=use_cache))
             urls_to_process = [updated_url]
 
         # For other calendar-based sites (e.g., valdostacity.com, chamber), fetch multiple months
         # Skip for meetings: their listing pages are single authoritative sources; extra month
         # fetches hit invalid URLs and waste 5-10s per attempt.
         elif source_type != 'meetings' and not use_structural_parsing and soup.find("table"):
-            from dateutil.relativedelta import relativedelta
-            current_date = datetime.now()
-            for i in range(1, 7):  # Get next 6 months
-                month_date = current_date + relativedelta(months=i)
-                month_str = month_date.strftime("%Y-%m")
-                if '?' in url:
-                    month_url = f"{url.split('?')[0]}?month={month_str}"
-                else:
-                    month_url = f"{url}?month={month_str}"
-                urls_to_process.append(month_url)
+            month_strs = [(now + relativedelta(months=i)).strftime("%Y-%m")
+                          for i in range(1, 7)]  # Get next 6 months
+            urls_to_process.extend(_month_urls(url, month_strs))
             print(f"[Two-Stage] Detected calendar site, will process {len(urls_to_process)} months")
 
+        # Download the additional months up front so they load concurrently; a month whose
+        # URL format doesn't work is logged and skipped rather than failing the scrape
+        pages = _fetch_all([process_url for process_url in urls_to_process if process_url != url],
+                           use_cache=use_cache)
+
+        # Stage 1 prompts are collected per page and sent together below
+        stage1_prompts = []
+
         # Process each URL (current month + future months if calendar)
         for process_url in urls_to_process:
             if process_url != url:
-                # Try to fetch additional months, but don't fail if the URL format doesn't work
-                try:
-                    resp = requests.get(process_url, headers=headers, timeout=15)
-                    resp.raise_for_status()
-                    soup = BeautifulSoup(resp.text, "html.parser")
-                except Exception as e:
-                    print(f"  [Two-Stage] Could not fetch {process_url}: {e}")
-                    print(f"  [Two-Stage] Continuing with events from previous months...")
-                    continue
+                if process_url not in pages:
+                    continue  # Fetch failed (already logged), continue with the other months
+                soup = _make_soup(pages[process_url])
 
             if not use_structural_parsing:
                 # AI-based extraction for sites with unknown structure
-                # Remove unnecessary elements
-                for element in soup(["script", "style", "nav", "footer", "header"]):
-                    element.decompose()
+                # Remove unnecessary elements and attributes
+                _strip_page_noise(soup)
 
                 # SPECIAL HANDLING: Filter for classes only on turnercenter.org
                 # Classes are marked with CSS class 'cat_classes' or 'tribe_events_cat-classes'
@@ -934,25 +1445,26 @@ def _scrape_twostage(url: str, openai_client: OpenAI, source_type: str = "events
 
                     if classes_only:
                         # Create a new soup with only class events
-                        filtered_html = '\n'.join([str(e) for e in classes_only])
-                        html_content = filtered_html[:60000]
+                        html_content = _join_html(classes_only, 60000)
                     else:
                         # If no classes found with filter, fall back to regular extraction
                         print(f"  [FILTER] WARNING: No classes found with cat_classes filter, using all events")
-                        html_content = str(soup.body)[:60000] if soup.body else str(soup)[:60000]
+                        html_content = _inner_html(soup.body or soup, 60000)
                 else:
                     # Get main content for other sites
-                    main_content = soup.find(["main", "article"]) or soup.find("div", class_=re.compile(r"main|content", re.I))
+                    main_content = soup.find(["main", "article"]) or soup.find("div", class_=_MAIN_OR_CONTENT_CLASS_RE)
+                    # Serialize the container once (at most the 30k chars we send) for the size check and the slice
+                    main_html = _inner_html(main_content, 30000) if main_content else ""
                     # If main_content is too small (< 5000 chars), it's probably just navigation
                     # Use full body instead to capture all event content
-                    if main_content and len(str(main_content)) < 5000:
-                        print(f"  HTML extraction: Main container too small ({len(str(main_content))} chars), using full body")
+                    if main_content and len(main_html) < 5000:
+                        print(f"  HTML extraction: Main container too small ({len(main_html)} chars), using full body")
                         # For sites with content deep in the page, use more content (up to 60000 chars)
-                        html_content = str(soup.body)[:60000] if soup.body else str(soup)[:60000]
+                        html_content = _inner_html(soup.body or soup, 60000)
                     elif main_content:
-                        html_content = str(main_content)[:30000]
+                        html_content = main_html[:30000]
                     else:
-                        html_content = str(soup.body)[:60000] if soup.body else str(soup)[:60000]
+                        html_content = _inner_html(soup.body or soup, 60000)
 
                 # Generate category-specific Stage 1 prompt
                 if source_type == 'classes':
@@ -971,7 +1483,7 @@ CLASSES-SPECIFIC:
 - Parse times: "2:00pm" → "14:00", default to "10:00" if not found
 - Extract ALL classes from today and beyond - include classes that start today even if they started earlier today
 
-Return JSON: [{{"title": "...", "url": "...", "date": "...", "time": "...", "recurring_pattern": "..."}}]
+Return a JSON object: {{"items": [{{"title": "...", "url": "...", "date": "...", "time": "...", "recurring_pattern": "..."}}]}}
 
 HTML:
 {html_content}
@@ -992,7 +1504,7 @@ MEETINGS-SPECIFIC:
 - For recurring meetings, note the pattern
 - Extract ALL meetings from today and beyond - include meetings that start today even if they started earlier today
 
-Return JSON: [{{"title": "...", "url": "...", "date": "...", "time": "...", "recurring_pattern": "..."}}]
+Return a JSON object: {{"items": [{{"title": "...", "url": "...", "date": "...", "time": "...", "recurring_pattern": "..."}}]}}
 
 HTML:
 {html_content}
@@ -1019,82 +1531,21 @@ INSTRUCTIONS:
 - For calendar tables, look for links within cells
 - Parse times: "7:00pm" → "19:00", "10:00am" → "10:00"
 - Use current or upcoming year (2026) for dates
-- Extract ALL events from today ({datetime.now().strftime("%Y-%m-%d")}) through ALL future months shown (including April, May, June, and beyond)
+- Extract ALL events from today ({today_str}) through ALL future months shown (including April, May, June, and beyond)
 - Include ALL events for today even if they started earlier today - do NOT filter by time of day
-- Only skip events that are clearly before today's date ({datetime.now().strftime("%Y-%m-%d")})
+- Only skip events that are clearly before today's date ({today_str})
 - If multiple events occur on the same day, extract ALL of them
 - Do NOT stop at the end of the current month - continue through every month listed on the page
 
-Return JSON array: [{{"title": "...", "url": "...", "date": "...", "time": "...", "recurring_pattern": "..."}}]
+Return a JSON object: {{"items": [{{"title": "...", "url": "...", "date": "...", "time": "...", "recurring_pattern": "..."}}]}}
 
-If no events found, return: []
+If no events found, return: {{"items": []}}
 
 HTML:
 {html_content}
 """
 
-                ai_response = openai_client.chat.completions.create(
-                    model="gpt-4o-mini",
-                    messages=[{"role": "user", "content": stage1_prompt}],
-                    temperature=0.1
-                )
-
-                ai_raw = ai_response.choices[0].message.content.strip()
-                if ai_raw.startswith("```json"):
-                    ai_raw = ai_raw[7:]
-                if ai_raw.startswith("```"):
-                    ai_raw = ai_raw[3:]
-                if ai_raw.endswith("```"):
-                    ai_raw = ai_raw[:-3]
-                ai_raw = ai_raw.strip()
-
-                try:
-                    extracted_events = json.loads(ai_raw)
-                    print(f"  AI extracted {len(extracted_events)} items from {process_url}")
-                    if extracted_events:
-                        print(f"  Sample item: {extracted_events[0]}")
-
-                    for event in extracted_events:
-                        title = event.get('title', '')
-                        event_url = event.get('url', '')
-                        event_date = event.get('date') or ''
-                        event_time = event.get('time') or ''
-                        recurring_pattern = event.get('recurring_pattern', '')
-
-                        # Make URL absolute
-                        if event_url and not event_url.startswith('http'):
-                            from urllib.parse import urljoin
-                            event_url = urljoin(url, event_url)
-                        elif not event_url:
-                            # If no specific event URL, use the main page URL
-                            event_url = process_url
-
-                        # Check if this needs Stage 2 scraping:
-                        # - External URLs (not valdostacity.com) always need Stage 2
-                        # - Internal event pages (/event/...) need Stage 2 for descriptions
-                        # - Events without specific URLs (using main page URL) don't need Stage 2
-                        needs_stage2 = event_url != process_url and event_url and ("valdostacity.com" not in event_url or "/event/" in event_url)
-
-                        if title:
-                            # Debug: check for suspicious titles
-                            if title.lower() in ['unknown', 'untitled', 'tbd', 'tba']:
-                                print(f"    ⚠️  WARNING: Suspicious title '{title}' extracted from {process_url}")
-
-                            event_urls.append({
-                                "title": title,
-                                "url": event_url,
-                                "has_external_url": needs_stage2,
-                                "date": event_date,
-                                "time": event_time,
-                                "description": "",
-                                "recurring_pattern": recurring_pattern  # Store recurring pattern from Stage 1
-                            })
-                            print(f"    Adding: {title} on {event_date}")
-                            if recurring_pattern:
-                                print(f"      Recurring: {recurring_pattern}")
-                except Exception as e:
-                    print(f"  Error parsing AI response: {e}")
-                    continue
+                stage1_prompts.append((process_url, stage1_prompt))
             else:
                 # Structural parsing for visitvaldosta.org
                 event_containers = soup.find_all("article", class_="event")
@@ -1124,7 +1575,7 @@ HTML:
                         desc_text = desc_elem.get_text() if desc_elem else ""
 
                         # Look for time in description
-                        time_match = re.search(r'(\d{1,2}):(\d{2})\s*(AM|PM|am|pm)', desc_text, re.I)
+                        time_match = _CLOCK_TIME_RE.search(desc_text)
                         if time_match:
                             hour = int(time_match.group(1))
                             minute = time_match.group(2)
@@ -1145,27 +1596,35 @@ HTML:
                         if day and month and title:
                             try:
                                 # Detect date range in the day field
-                                range_match = re.search(r'(\d{1,2})\s*[-–&]\s*(\d{1,2})', day)
+                                range_match = _DAY_RANGE_RE.search(day)
                                 if range_match:
                                     start_day = int(range_match.group(1))
                                     end_day = int(range_match.group(2))
                                     days_to_process = list(range(start_day, end_day + 1))
                                 else:
                                     # Single day — strip any non-numeric suffix
-                                    day_num = re.search(r'\d+', day)
+                                    day_num = _DIGITS_RE.search(day)
                                     days_to_process = [int(day_num.group())] if day_num else []
 
                                 has_external_url = event_url and "visitvaldosta.org" not in event_url if event_url else False
 
-                                if title.lower() in ['unknown', 'untitled', 'tbd', 'tba']:
+                                if title.lower() in _PLACEHOLDER_TITLES:
                                     print(f"[Two-Stage]   ⚠️  WARNING: Suspicious title '{title}' extracted!")
 
+                                # Cards show a month name/abbreviation, so look it up directly
+                                # rather than running dateutil for every day
+                                month_num = _MONTH_NUMBERS.get(month[:3].lower())
                                 for d in days_to_process:
-                                    date_str = f"{d} {month} {current_year}"
-                                    parsed_date = dateparser.parse(date_str)
-                                    if not parsed_date:
-                                        continue
-                                    if parsed_date.date() < datetime.now().date():
+                                    if month_num:
+                                        try:
+                                            parsed_date = datetime(current_year, month_num, d)
+                                        except ValueError:
+                                            continue
+                                    else:
+                                        parsed_date = _parse_date(f"{d} {month} {current_year}")
+                                        if not parsed_date:
+                                            continue
+                                    if parsed_date.date() < today_date:
                                         parsed_date = parsed_date.replace(year=current_year + 1)
 
                                     formatted_date = parsed_date.strftime("%Y-%m-%d")
@@ -1189,33 +1648,96 @@ HTML:
 
                 print(f"[Two-Stage] Stage 1: Successfully extracted {len(event_urls)} events using structural parsing")
 
+        # Run the Stage 1 AI calls for all pages concurrently - each call is mostly network wait.
+        # Cached by prompt when caching is on, so an unchanged listing page isn't re-extracted;
+        # the schema constrains the reply to a bare {"items": [...]} object
+        futures = []
+        if stage1_prompts:
+            with ThreadPoolExecutor(max_workers=min(7, len(stage1_prompts))) as executor:
+                futures = [executor.submit(_chat_completion, openai_client, "gpt-4o-mini", stage1_prompt,
+                                           response_format=_STAGE1_RESPONSE_FORMAT,
+                                           use_cache=use_cache, is_valid=_has_items)
+                           for _, stage1_prompt in stage1_prompts]
+
+        # Parse the replies in page order
+        for (process_url, _), future in zip(stage1_prompts, futures):
+            try:
+                ai_raw = future.result()
+            except Exception as e:
+                print(f"  Error extracting events from {process_url}: {e}")
+                continue
+
+            try:
+                extracted_events = json_loads(ai_raw).get("items", [])
+                print(f"  AI extracted {len(extracted_events)} items from {process_url}")
+                if extracted_events:
+                    print(f"  Sample item: {extracted_events[0]}")
+
+                for event in extracted_events:
+                    title = event.get('title', '')
+                    event_url = event.get('url', '')
+                    event_date = event.get('date') or ''
+                    event_time = event.get('time') or ''
+                    recurring_pattern = event.get('recurring_pattern', '')
+
+                    # Make URL absolute
+                    if event_url and not event_url.startswith('http'):
+                        event_url = urljoin(url, event_url)
+                    elif not event_url:
+                        # If no specific event URL, use the main page URL
+                        event_url = process_url
+
+                    # Check if this needs Stage 2 scraping:
+                    # - External URLs (not valdostacity.com) always need Stage 2
+                    # - Internal event pages (/event/...) need Stage 2 for descriptions
+                    # - Events without specific URLs (using main page URL) don't need Stage 2
+                    needs_stage2 = event_url != process_url and event_url and ("valdostacity.com" not in event_url or "/event/" in event_url)
+
+                    if title:
+                        # Debug: check for suspicious titles
+                        if title.lower() in _PLACEHOLDER_TITLES:
+                            print(f"    ⚠️  WARNING: Suspicious title '{title}' extracted from {process_url}")
+
+                        event_urls.append({
+                            "title": title,
+                            "url": event_url,
+                            "has_external_url": needs_stage2,
+                            "date": event_date,
+                            "time": event_time,
+                            "description": "",
+                            "recurring_pattern": recurring_pattern  # Store recurring pattern from Stage 1
+                        })
+                        print(f"    Adding: {title} on {event_date}")
+                        if recurring_pattern:
+                            print(f"      Recurring: {recurring_pattern}")
+            except Exception as e:
+                print(f"  Error parsing AI response: {e}")
+                continue
+
         # After processing all URLs
         print(f"[Two-Stage] Stage 1 completed: {len(event_urls)} events extracted total")
 
+        # Past-event cutoff (yesterday, for UTC server offset) and the Stage 2 date window,
+        # computed once rather than per event
+        cutoff_date = (now - timedelta(days=1)).date()
+        six_months_later = now + timedelta(days=180)
+
         # Separate events into two groups:
         # 1. Events with external URLs - need Stage 2 scraping
         # 2. Events without external URLs - use dates from listing page
         events_with_external_urls = []
         events_without_external_urls = []
-        seen_keys = set()  # Deduplicate by title + date
+        seen_keys = set()  # Deduplicate by (title, date)
 
         for event in event_urls:
-            event_title = event.get('title', 'Untitled')
-            event_date = event.get('date', '')
-            has_external_url = event.get('has_external_url', False)
-
-            # Create deduplication key
-            dedup_key = f"{event_title.lower().strip()}_{event_date}"
-
+            # Tuple key: no string formatting per event, and hashed once on insert
+            dedup_key = (event.get('title', 'Untitled').lower().strip(), event.get('date', ''))
             if dedup_key in seen_keys:
                 continue
-
             seen_keys.add(dedup_key)
 
-            if has_external_url and event.get('url'):
-                events_with_external_urls.append(event)
-            else:
-                events_without_external_urls.append(event)
+            group = events_with_external_urls if event.get('has_external_url') and event.get('url') else events_without_external_urls
+            group.append(event)
 
         print(f"[Two-Stage] Stage 1: {len(events_with_external_urls)} events with external URLs, {len(events_without_external_urls)} events without")
 
@@ -1228,7 +1750,7 @@ HTML:
             skipped = 0
             for event in events_with_external_urls:
                 time_str = (event.get('time') or '').strip()
-                if re.match(r'^\d{2}:\d{2}$', time_str):
+                if _HHMM_RE.match(time_str):
                     events_without_external_urls.append(event)
                     skipped += 1
                     print(f"[Two-Stage]   Layer 2 skip Stage 2: {event.get('title', '')} on {event.get('date', '')} at {time_str}")
@@ -1246,19 +1768,18 @@ HTML:
             event_url = event.get('url', url)  # Use listing page URL if no specific URL
 
             # Fix common typos in title
-            if "Galentine's" in event_title or "galentine's" in event_title.lower():
-                event_title = event_title.replace("Galentine's", "Valentine's").replace("galentine's", "Valentine's")
+            event_title = _GALENTINE_RE.sub("Valentine's", event_title)
 
             # Validate date format
+            event_recurring = event.get('recurring_pattern', '')
+            is_recurring = _is_supported_recurring_pattern(event_recurring)
             try:
                 parsed_date = datetime.fromisoformat(event_date).date()
-                event_recurring = event.get('recurring_pattern', '')
-                is_recurring = _is_supported_recurring_pattern(event_recurring)
 
                 # Skip past dates UNLESS it's a supported recurring event
-                if parsed_date >= (datetime.now() - timedelta(days=1)).date() or is_recurring:
+                if parsed_date >= cutoff_date or is_recurring:
                     # Validate time format; keep empty as-is (no confirmed time)
-                    if event_time and not re.match(r'^\d{2}:\d{2}$', event_time):
+                    if event_time and not _HHMM_RE.match(event_time):
                         event_time = ''
 
                     all_day = not event_time
@@ -1281,7 +1802,7 @@ HTML:
 
         # Stage 2: Scrape pages for events WITH external URLs (parallel)
         if events_with_external_urls:
-            print(f"[Two-Stage] Stage 2: Scraping {len(events_with_external_urls)} event pages in parallel (max 8 workers)")
+            print(f"[Two-Stage] Stage 2: Scraping {len(events_with_external_urls)} event pages in parallel (max {_STAGE2_MAX_WORKERS} workers)")
 
         def scrape_one_event(event):
             """Fetch + AI-process one event page. Returns list of result items."""
@@ -1299,14 +1820,11 @@ HTML:
             results = []
 
             try:
-                # Fetch event page
-                event_resp = requests.get(event_url, headers=headers, timeout=15)
-                event_resp.raise_for_status()
-                event_soup = BeautifulSoup(event_resp.text, "html.parser")
+                # Fetch event page (pooled session, size-capped, reused if fetched within the hour)
+                event_soup = _make_soup(_get_html(event_url, use_cache=use_cache))
 
-                # Remove script, style, nav, footer, and header elements
-                for element in event_soup(["script", "style", "nav", "footer", "header"]):
-                    element.decompose()
+                # Remove script, style, nav, footer, header and svg elements and noise attributes
+                _strip_page_noise(event_soup)
 
                 # Get event page content: prefer <main> or <article> to avoid
                 # large nav/header HTML pushing the actual event details past the
@@ -1315,46 +1833,27 @@ HTML:
                            event_soup.find("article") or
                            event_soup.find(id="main") or
                            event_soup.find(id="content"))
-                if main_el:
-                    event_content = str(main_el)[:30000]
-                elif event_soup.body:
-                    event_content = str(event_soup.body)[:30000]
-                else:
-                    event_content = str(event_soup)[:30000]
+                event_content = _inner_html(main_el or event_soup.body or event_soup, 30000)
 
                 # Stage 2 AI prompt - Use category-specific prompts
-                today = datetime.now()
-                six_months_later = today + timedelta(days=180)
-
                 # Generate category-specific Stage 2 prompt
                 if source_type == 'classes':
-                    stage2_prompt = _generate_stage2_classes_prompt(event_title, event_content, listing_date, today, six_months_later)
+                    stage2_prompt = _generate_stage2_classes_prompt(event_title, event_content, listing_date, now, six_months_later)
                 elif source_type == 'meetings':
-                    stage2_prompt = _generate_stage2_meetings_prompt(event_title, event_content, listing_date, today, six_months_later)
+                    stage2_prompt = _generate_stage2_meetings_prompt(event_title, event_content, listing_date, now, six_months_later)
                 else:  # events (default)
-                    stage2_prompt = _generate_stage2_events_prompt(event_title, event_content, listing_date, today, six_months_later)
-
-                # Use gpt-4o-mini for all Stage 2 processing
-                stage2_response = openai_client.chat.completions.create(
-                    model="gpt-4o-mini",
-                    messages=[{"role": "user", "content": stage2_prompt}],
-                    temperature=0.1
-                )
-
-                stage2_raw = stage2_response.choices[0].message.content.strip()
-
-                # Clean JSON markers
-                if stage2_raw.startswith("```json"):
-                    stage2_raw = stage2_raw[7:]
-                if stage2_raw.startswith("```"):
-                    stage2_raw = stage2_raw[3:]
-                if stage2_raw.endswith("```"):
-                    stage2_raw = stage2_raw[:-3]
-                stage2_raw = stage2_raw.strip()
+                    stage2_prompt = _generate_stage2_events_prompt(event_title, event_content, listing_date, now, six_months_later)
+
+                # Use gpt-4o-mini for all Stage 2 processing (cached by prompt when caching is on,
+                # so an unchanged event page isn't re-extracted); JSON mode, since the classes
+                # reply nests a list and the other types carry type-specific fields
+                stage2_raw = _chat_completion(openai_client, "gpt-4o-mini", stage2_prompt,
+                                              response_format=_JSON_OBJECT_RESPONSE_FORMAT,
+                                              use_cache=use_cache, is_valid=_is_json_object)
 
                 # Parse JSON
                 try:
-                    event_data = json.loads(stage2_raw)
+                    event_data = json_loads(stage2_raw)
 
                     # Special handling for CLASSES: multiple classes per page
                     if source_type == 'classes' and 'classes' in event_data:
@@ -1395,7 +1894,7 @@ HTML:
                                     continue
 
                             # Validate time format; keep empty string as-is (means no confirmed time)
-                            if time_str and not re.match(r'^\d{2}:\d{2}$', time_str):
+                            if time_str and not _HHMM_RE.match(time_str):
                                 time_str = ''
 
                             # Create calendar entry for each date
@@ -1405,12 +1904,12 @@ HTML:
                                     is_recurring = _is_supported_recurring_pattern(recurring_pattern)
 
                                     # Skip past dates UNLESS it's a supported recurring class
-                                    if event_date >= (datetime.now() - timedelta(days=1)).date() or is_recurring:
+                                    if event_date >= cutoff_date or is_recurring:
                                         all_day = not time_str
                                         result_item = {
                                             "title": full_title,
                                             "url": event_url,
-                                            "description": _truncate_description(description),
+                                            "description": description,
                                             "start": date_str if all_day else f"{date_str}T{time_str}:00",
                                             "allDay": all_day,
                                             "recurring_pattern": recurring_pattern
@@ -1448,8 +1947,8 @@ HTML:
                         event_title = corrected_title.strip()
 
                     # Fix common typos in title
-                    if "Galentine's" in event_title or "galentine's" in event_title.lower():
-                        event_title = event_title.replace("Galentine's", "Valentine's").replace("galentine's", "Valentine's")
+                    event_title, typo_fixes = _GALENTINE_RE.subn("Valentine's", event_title)
+                    if typo_fixes:
                         print(f"[Two-Stage]   Fixed typo: Galentine's → Valentine's")
 
                     # Skip cancelled/postponed events
@@ -1484,12 +1983,12 @@ HTML:
                             return []
 
                     # Validate time format; keep empty as-is (no confirmed time)
-                    if time_str and not re.match(r'^\d{2}:\d{2}$', time_str):
+                    if time_str and not _HHMM_RE.match(time_str):
                         time_str = ''
 
                     # If Stage 2 found no time (e.g. Facebook/blocked page returned empty),
                     # fall back to the time Stage 1 extracted from the listing page.
-                    if not time_str and fallback_time and re.match(r'^\d{2}:\d{2}$', fallback_time):
+                    if not time_str and fallback_time and _HHMM_RE.match(fallback_time):
                         time_str = fallback_time
                         print(f"[Two-Stage]   Using Stage 1 fallback time {fallback_time} for {event_title}")
 
@@ -1502,12 +2001,12 @@ HTML:
                             is_recurring = _is_supported_recurring_pattern(recurring_pattern)
 
                             # Skip past dates UNLESS it's a supported recurring event
-                            if event_date >= (datetime.now() - timedelta(days=1)).date() or is_recurring:
+                            if event_date >= cutoff_date or is_recurring:
                                 all_day = not time_str
                                 result_item = {
                                     "title": event_title,
                                     "url": event_url,
-                                    "description": _truncate_description(description),
+                                    "description": description,
                                     "start": date_str if all_day else f"{date_str}T{time_str}:00",
                                     "allDay": all_day,
                                     "recurring_pattern": recurring_pattern
@@ -1534,9 +2033,7 @@ HTML:
                 fallback_time = event.get('time', '')
 
                 # Fix common typos in title
-                fallback_title = event_title
-                if "Galentine's" in fallback_title or "galentine's" in fallback_title.lower():
-                    fallback_title = fallback_title.replace("Galentine's", "Valentine's").replace("galentine's", "Valentine's")
+                fallback_title = _GALENTINE_RE.sub("Valentine's", event_title)
 
                 if fallback_date:
                     try:
@@ -1545,8 +2042,8 @@ HTML:
                         is_recurring = _is_supported_recurring_pattern(fallback_recurring)
 
                         # Skip past dates UNLESS it's a supported recurring event
-                        if parsed_date >= (datetime.now() - timedelta(days=1)).date() or is_recurring:
-                            if fallback_time and not re.match(r'^\d{2}:\d{2}$', fallback_time):
+                        if parsed_date >= cutoff_date or is_recurring:
+                            if fallback_time and not _HHMM_RE.match(fallback_time):
                                 fallback_time = ''
                             fallback_desc = _truncate_description(event.get('description', ''))
                             all_day = not fallback_time
@@ -1572,9 +2069,7 @@ HTML:
                 fallback_time = event.get('time', '')
 
                 # Fix common typos in title
-                fallback_title = event_title
-                if "Galentine's" in fallback_title or "galentine's" in fallback_title.lower():
-                    fallback_title = fallback_title.replace("Galentine's", "Valentine's").replace("galentine's", "Valentine's")
+                fallback_title = _GALENTINE_RE.sub("Valentine's", event_title)
 
                 if fallback_date:
                     try:
@@ -1583,8 +2078,8 @@ HTML:
                         is_recurring = _is_supported_recurring_pattern(fallback_recurring)
 
                         # Skip past dates UNLESS it's a supported recurring event
-                        if parsed_date >= (datetime.now() - timedelta(days=1)).date() or is_recurring:
-                            if fallback_time and not re.match(r'^\d{2}:\d{2}$', fallback_time):
+                        if parsed_date >= cutoff_date or is_recurring:
+                            if fallback_time and not _HHMM_RE.match(fallback_time):
                                 fallback_time = ''
                             fallback_desc = _truncate_description(event.get('description', ''))
                             all_day = not fallback_time
@@ -1614,8 +2109,8 @@ HTML:
                         parsed_date = datetime.fromisoformat(fallback_date).date()
                         fallback_recurring = event.get('recurring_pattern', '')
                         is_recurring = _is_supported_recurring_pattern(fallback_recurring)
-                        if parsed_date >= (datetime.now() - timedelta(days=1)).date() or is_recurring:
-                            if fallback_time and not re.match(r'^\d{2}:\d{2}$', fallback_time):
+                        if parsed_date >= cutoff_date or is_recurring:
+                            if fallback_time and not _HHMM_RE.match(fallback_time):
                                 fallback_time = ''
                             fallback_desc = _truncate_description(event.get('description', ''))
                             all_day = not fallback_time
@@ -1634,7 +2129,7 @@ HTML:
 
             return results
 
-        with ThreadPoolExecutor(max_workers=4) as executor:
+        with ThreadPoolExecutor(max_workers=_STAGE2_MAX_WORKERS) as executor:
             futures = {executor.submit(scrape_one_event, event): event
                        for event in events_with_external_urls}
             for future in as_completed(futures):
@@ -1651,11 +2146,9 @@ HTML:
         seen_keys = set()
 
         for event in all_results:
-            event_date = event['start'].split('T')[0]
-            event_url = event['url']
-            event_title = event.get('title', '').lower()[:50]  # First 50 chars, lowercase
-            # Create key from URL + date + title
-            dedup_key = f"{event_url}_{event_date}_{event_title}"
+            # Key on URL + date + first 50 chars of the lowercased title; a tuple hashes
+            # without formatting a string per event
+            dedup_key = (event['url'], event['start'][:10], event.get('title', '').lower()[:50])
 
             if dedup_key not in seen_keys:
                 seen_keys.add(dedup_key)
@@ -1675,6 +2168,25 @@ HTML:
         return []
 
 
+# Monthly "nth weekday" patterns expanded by _expand_recurring_events, checked in order:
+# (lowercase phrases, label for logs, weekday with 0=Monday, which occurrence in the month)
+_MONTHLY_RECURRING_PATTERNS = (
+    (('first friday', '1st friday'), 'First Friday', 4, 1),
+    (('second saturday', '2nd saturday'), 'Second Saturday', 5, 2),
+    (('third tuesday', '3rd tuesday'), 'Third Tuesday', 1, 3),
+)
+
+# Recurring patterns _expand_recurring_events knows how to expand (lowercase substrings)
+_SUPPORTED_RECURRING_PATTERNS = (
+    'first friday', '1st friday',
+    'second saturday', '2nd saturday',
+    'third tuesday', '3rd tuesday',
+    # Weekly patterns for classes
+    'every monday', 'every tuesday', 'every wednesday', 'every thursday',
+    'every friday', 'every saturday', 'every sunday',
+)
+
+
 def _is_supported_recurring_pattern(recurring_pattern: str) -> bool:
     """
     Check if a recurring pattern is actually supported for expansion.
@@ -1684,18 +2196,13 @@ def _is_supported_recurring_pattern(recurring_pattern: str) -> bool:
         return False
 
     pattern_lower = recurring_pattern.lower()
+    return any(p in pattern_lower for p in _SUPPORTED_RECURRING_PATTERNS)
 
-    # Supported patterns
-    supported = [
-        'first friday', '1st friday',
-        'second saturday', '2nd saturday',
-        'third tuesday', '3rd tuesday',
-        # Weekly patterns for classes
-        'every monday', 'every tuesday', 'every wednesday', 'every thursday',
-        'every friday', 'every saturday', 'every sunday',
-    ]
 
-    return any(p in pattern_lower for p in supported)
+def _nth_weekday(year: int, month: int, weekday: int, nth: int) -> datetime:
+    """The nth given weekday (0=Monday) of a month, e.g. (2026, 2, 4, 1) for its first Friday"""
+    first_day = datetime(year, month, 1)
+    return first_day + timedelta(days=(weekday - first_day.weekday()) % 7 + 7 * (nth - 1))
 
 
 def _expand_recurring_events(results: List[Dict], source_type: str = "events") -> List[Dict]:
@@ -1704,15 +2211,18 @@ def _expand_recurring_events(results: List[Dict], source_type: str = "events") -
     IMPORTANT: Classes and meetings are NEVER expanded - they should provide specific dates only.
     Only events use recurring pattern expansion.
     """
-    from dateutil.relativedelta import relativedelta
-    from calendar import monthrange
-
     # SAFEGUARD: Never expand classes or meetings, even if AI accidentally sets recurring_pattern
     # Meetings are scheduled with specific dates on their websites and should be displayed as-is
     if source_type in ['classes', 'meetings']:
         print(f"  [RECURRING] Skipping expansion for {source_type} ({source_type} should have specific dates only)")
         return results
 
+    # Read the clock once: today's date and the (year, month) of this month and the next
+    # five, shared by every event's expansion below
+    now = datetime.now()
+    today = now.date()
+    months_ahead = [(d.year, d.month) for d in (now + relativedelta(months=i) for i in range(6))]
+
     expanded = []
     for event in results:
         title = event.get('title', '').lower()
@@ -1725,9 +2235,12 @@ def _expand_recurring_events(results: List[Dict], source_type: str = "events") -
         # Track if this is a recurring event
         is_recurring = False
 
-        # Pattern 1: First Friday (or 1st Friday)
-        if 'first friday' in search_text or '1st friday' in search_text:
-            print(f"  [RECURRING] Detected 'First Friday' pattern: {event['title']}")
+        # Patterns 1-3: First Friday, Second Saturday, Third Tuesday (or 1st/2nd/3rd)
+        monthly = next((p for p in _MONTHLY_RECURRING_PATTERNS
+                        if any(phrase in search_text for phrase in p[0])), None)
+        if monthly:
+            _, label, weekday, nth = monthly
+            print(f"  [RECURRING] Detected '{label}' pattern: {event['title']}")
             if recurring_pattern:
                 print(f"    Pattern field: {recurring_pattern}")
             is_recurring = True
@@ -1741,24 +2254,14 @@ def _expand_recurring_events(results: List[Dict], source_type: str = "events") -
                 else:
                     event_time = None
 
-                # Generate first Friday of each month for next 6 months
-                current_date = datetime.now()
-                for i in range(6):
-                    target_month = current_date + relativedelta(months=i)
-                    year = target_month.year
-                    month = target_month.month
-
-                    # Find first Friday of the month
-                    # Get the first day of the month
-                    first_day = datetime(year, month, 1)
-                    # Friday is weekday 4 (0=Monday, 4=Friday)
-                    days_until_friday = (4 - first_day.weekday()) % 7
-                    first_friday = first_day + timedelta(days=days_until_friday)
+                # Generate the matching weekday of each month for next 6 months
+                for year, month in months_ahead:
+                    occurrence = _nth_weekday(year, month, weekday, nth)
 
                     # Only add if it's in the future
-                    if first_friday.date() >= datetime.now().date():
+                    if occurrence.date() >= today:
                         recurring_event = event.copy()
-                        date_str = first_friday.strftime('%Y-%m-%d')
+                        date_str = occurrence.strftime('%Y-%m-%d')
                         if event_time:
                             recurring_event['start'] = f"{date_str}T{event_time}"
                             recurring_event['allDay'] = False
@@ -1766,96 +2269,12 @@ def _expand_recurring_events(results: List[Dict], source_type: str = "events") -
                             recurring_event['start'] = date_str
                             recurring_event['allDay'] = True
                         expanded.append(recurring_event)
-                        print(f"    [RECURRING] Generated: {event['title']} on {first_friday.strftime('%Y-%m-%d')}")
+                        print(f"    [RECURRING] Generated: {event['title']} on {date_str}")
             except Exception as e:
                 print(f"    [RECURRING] Error expanding: {e}")
                 # If expansion fails, just add the original event
                 expanded.append(event)
 
-        # Pattern 2: Second Saturday (or 2nd Saturday)
-        elif 'second saturday' in search_text or '2nd saturday' in search_text:
-            print(f"  [RECURRING] Detected 'Second Saturday' pattern: {event['title']}")
-            if recurring_pattern:
-                print(f"    Pattern field: {recurring_pattern}")
-            is_recurring = True
-
-            original_start = event.get('start', '')
-            try:
-                if 'T' in original_start:
-                    event_time = original_start.split('T')[1]
-                else:
-                    event_time = None
-
-                current_date = datetime.now()
-                for i in range(6):
-                    target_month = current_date + relativedelta(months=i)
-                    year = target_month.year
-                    month = target_month.month
-
-                    # Find second Saturday of the month
-                    first_day = datetime(year, month, 1)
-                    # Saturday is weekday 5
-                    days_until_saturday = (5 - first_day.weekday()) % 7
-                    first_saturday = first_day + timedelta(days=days_until_saturday)
-                    second_saturday = first_saturday + timedelta(days=7)
-
-                    if second_saturday.date() >= datetime.now().date():
-                        recurring_event = event.copy()
-                        date_str = second_saturday.strftime('%Y-%m-%d')
-                        if event_time:
-                            recurring_event['start'] = f"{date_str}T{event_time}"
-                            recurring_event['allDay'] = False
-                        else:
-                            recurring_event['start'] = date_str
-                            recurring_event['allDay'] = True
-                        expanded.append(recurring_event)
-                        print(f"    [RECURRING] Generated: {event['title']} on {second_saturday.strftime('%Y-%m-%d')}")
-            except Exception as e:
-                print(f"    [RECURRING] Error expanding: {e}")
-                expanded.append(event)
-
-        # Pattern 3: Third Tuesday (or 3rd Tuesday)
-        elif 'third tuesday' in search_text or '3rd tuesday' in search_text:
-            print(f"  [RECURRING] Detected 'Third Tuesday' pattern: {event['title']}")
-            if recurring_pattern:
-                print(f"    Pattern field: {recurring_pattern}")
-            is_recurring = True
-
-            original_start = event.get('start', '')
-            try:
-                if 'T' in original_start:
-                    event_time = original_start.split('T')[1]
-                else:
-                    event_time = None
-
-                current_date = datetime.now()
-                for i in range(6):
-                    target_month = current_date + relativedelta(months=i)
-                    year = target_month.year
-                    month = target_month.month
-
-                    # Find third Tuesday of the month
-                    first_day = datetime(year, month, 1)
-                    # Tuesday is weekday 1
-                    days_until_tuesday = (1 - first_day.weekday()) % 7
-                    first_tuesday = first_day + timedelta(days=days_until_tuesday)
-                    third_tuesday = first_tuesday + timedelta(days=14)
-
-                    if third_tuesday.date() >= datetime.now().date():
-                        recurring_event = event.copy()
-                        date_str = third_tuesday.strftime('%Y-%m-%d')
-                        if event_time:
-                            recurring_event['start'] = f"{date_str}T{event_time}"
-                            recurring_event['allDay'] = False
-                        else:
-                            recurring_event['start'] = date_str
-                            recurring_event['allDay'] = True
-                        expanded.append(recurring_event)
-                        print(f"    [RECURRING] Generated: {event['title']} on {third_tuesday.strftime('%Y-%m-%d')}")
-            except Exception as e:
-                print(f"    [RECURRING] Error expanding: {e}")
-                expanded.append(event)
-
         # Pattern 4: Every [Weekday] - for weekly recurring classes
         # Matches: "Every Monday", "Every Tuesday", "Every Wednesday", etc.
         elif any(day in search_text for day in ['every monday', 'every tuesday', 'every wednesday', 'every thursday', 'every friday', 'every saturday', 'every sunday']):
@@ -1887,7 +2306,7 @@ def _expand_recurring_events(results: List[Dict], source_type: str = "events") -
                         event_time = None  # No confirmed time; preserve allDay
 
                     # Generate occurrences for next 6 months (approx 26 weeks)
-                    current_date = datetime.now().date()
+                    current_date = today
 
                     # Find the next occurrence of this weekday (include today)
                     days_ahead = target_weekday - current_date.weekday()
@@ -1932,6 +2351,17 @@ def _expand_recurring_events(results: List[Dict], source_type: str = "events") -
     return expanded
 
 
+def _dedupe_key(title: str, date: str) -> tuple:
+    """Key for same-day duplicate detection: date + first 30 chars of the normalized title"""
+    # Normalize title for comparison (lowercase, collapse whitespace)
+    return (date, ' '.join(title.lower().split())[:30])
+
+
+def _iso_date(date_str: str) -> date:
+    """Date of a 'YYYY-MM-DD...' string we formatted ourselves (e.g. 'start'), read from fixed slices"""
+    return date(int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]))
+
+
 def _post_process_ai_results(results: List[Dict], source_type: str, base_url: str) -> List[Dict]:
     """Apply post-processing to AI results for consistency and quality"""
     print(f"  Post-processing: Starting with {len(results)} items")
@@ -1942,22 +2372,15 @@ def _post_process_ai_results(results: List[Dict], source_type: str, base_url: st
 
         # Step 1: Category-specific title cleanup
         if source_type == 'events':
-            # For events: Remove ordinals + "annual", year prefixes
-            # Remove ordinal indicators (1st, 2nd, 3rd, 4th, etc.) with "annual"
-            title = re.sub(r'^\d+(st|nd|rd|th)\s+annual\s+', '', title, flags=re.IGNORECASE)
-            # Remove standalone "annual" at beginning
-            title = re.sub(r'^annual\s+', '', title, flags=re.IGNORECASE)
-            # Remove year prefixes like "2026"
-            title = re.sub(r'^20\d{2}\s+', '', title)
-            # Remove month names at the beginning
-            title = re.sub(r'^(January|February|March|April|May|June|July|August|September|October|November|December)', '', title, flags=re.IGNORECASE)
+            # For events: Remove ordinals + "annual", year prefixes and leading month names
+            title = _EVENT_TITLE_PREFIX_RE.sub('', title)
 
         elif source_type == 'classes':
             # For classes: Keep ordinals (2nd Week, Week 3), don't remove year prefixes
             # Only remove leading bare numbers without ordinals
-            if not re.match(r'^\d+(st|nd|rd|th)\s', title, re.IGNORECASE):
-                if not re.match(r'^(week|session)\s+\d+', title, re.IGNORECASE):  # Keep "Week 3"
-                    title = re.sub(r'^\d+\s+', '', title)  # Remove bare leading numbers only
+            if not _ORDINAL_PREFIX_RE.match(title):
+                if not _WEEK_SESSION_PREFIX_RE.match(title):  # Keep "Week 3"
+                    title = _BARE_NUM_PREFIX_RE.sub('', title)  # Remove bare leading numbers only
 
         elif source_type == 'meetings':
             # For meetings: Keep everything including year prefixes (e.g., "2026 Annual Meeting")
@@ -1967,11 +2390,7 @@ def _post_process_ai_results(results: List[Dict], source_type: str, base_url: st
         title = title.strip()
 
         # Step 2: Filter out junk titles (UI elements, navigation, etc.)
-        junk_exact = ['log in', 'sign up', 'learn more', 'read more', 'click here',
-                     'menu', 'search', 'home', 'about', 'contact', 'privacy',
-                     'terms', 'getting there', 'share', 'save', 'map', 'photos']
-
-        if title.lower() in junk_exact:
+        if title.lower() in _JUNK_EXACT:
             continue
 
         # Step 3: Filter very short titles (but NOT duplicates - recurring events are OK!)
@@ -1983,14 +2402,15 @@ def _post_process_ai_results(results: List[Dict], source_type: str, base_url: st
         processed.append(item)
 
     # Step 4: Category-specific date filtering
+    # 'start' always begins with a zero-padded YYYY-MM-DD, so the cutoffs are compared as strings
     if source_type == 'events':
         # Events: Filter out past dates (use yesterday as cutoff for UTC server offset)
-        current_date = (datetime.now() - timedelta(days=1)).date()
+        cutoff = (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
         before_filter = len(processed)
         filtered_events = []
         for r in processed:
-            event_date = datetime.fromisoformat(r['start'].split('T')[0]).date()
-            if event_date >= current_date:
+            event_date = r['start'][:10]
+            if event_date >= cutoff:
                 filtered_events.append(r)
             else:
                 print(f"    Filtering past event: {r['title']} on {event_date}")
@@ -2002,14 +2422,15 @@ def _post_process_ai_results(results: List[Dict], source_type: str, base_url: st
         # Classes: DON'T filter past dates aggressively (might show recent history or ongoing classes)
         # Only filter dates more than 30 days in the past
         current_date = datetime.now().date()
+        cutoff = (current_date - timedelta(days=30)).strftime("%Y-%m-%d")
         before_filter = len(processed)
         filtered_classes = []
         for r in processed:
-            class_date = datetime.fromisoformat(r['start'].split('T')[0]).date()
-            days_diff = (current_date - class_date).days
-            if days_diff <= 30:  # Keep classes from last 30 days
+            if r['start'][:10] >= cutoff:  # Keep classes from last 30 days
                 filtered_classes.append(r)
             else:
+                class_date = _iso_date(r['start'])
+                days_diff = (current_date - class_date).days
                 print(f"    Filtering old class: {r['title']} on {class_date} ({days_diff} days ago)")
         processed = filtered_classes
         if before_filter > len(processed):
@@ -2017,12 +2438,12 @@ def _post_process_ai_results(results: List[Dict], source_type: str, base_url: st
 
     elif source_type == 'meetings':
         # Meetings: Filter out past dates (use yesterday as cutoff for UTC server offset)
-        current_date = (datetime.now() - timedelta(days=1)).date()
+        cutoff = (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
         before_filter = len(processed)
         filtered_meetings = []
         for r in processed:
-            meeting_date = datetime.fromisoformat(r['start'].split('T')[0]).date()
-            if meeting_date >= current_date:
+            meeting_date = r['start'][:10]
+            if meeting_date >= cutoff:
                 filtered_meetings.append(r)
             else:
                 print(f"    Filtering past meeting: {r['title']} on {meeting_date}")
@@ -2036,11 +2457,7 @@ def _post_process_ai_results(results: List[Dict], source_type: str, base_url: st
         seen = set()
 
         for event in processed:
-            event_date = event['start'].split('T')[0]
-            # Normalize title for comparison
-            normalized_title = ' '.join(event['title'].lower().split())
-            # Create key from date + first 30 chars of normalized title
-            key = f"{event_date}_{normalized_title[:30]}"
+            key = _dedupe_key(event['title'], event['start'][:10])
 
             if key not in seen:
                 seen.add(key)
@@ -2054,23 +2471,15 @@ def _post_process_ai_results(results: List[Dict], source_type: str, base_url: st
     return processed
 
 
-def scrape_generic_auto(url: str, source_type: str) -> List[Dict]:
-    """Attempt generic scraping patterns (fallback when AI is not available)"""
-    from datetime import datetime, timedelta
-    from dateutil.relativedelta import relativedelta
-
+def scrape_generic_auto(url: str, source_type: str, use_cache: bool = False) -> List[Dict]:
+    """
+    Attempt generic scraping patterns (fallback when AI is not available).
+    use_cache (the category's cache setting) allows reusing pages fetched within the last hour.
+    """
     try:
-        # Use moderate headers - enough to bypass most blocks, but not so many as to trigger bot detection
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.5"
-        }
-        resp = requests.get(url, headers=headers, timeout=15)
-        resp.raise_for_status()
-
-        soup = BeautifulSoup(resp.text, "html.parser")
+        soup = _make_soup(_get_html(url, use_cache=use_cache))
         results = []
+        today_str = datetime.now().strftime("%Y-%m-%d")  # Date stamped on attractions
 
         # Try common patterns
         # Pattern 1: Look for calendar table
@@ -2081,57 +2490,63 @@ def scrape_generic_auto(url: str, source_type: str) -> List[Dict]:
             current_date = datetime.now()
             months_to_check = [current_date + relativedelta(months=i) for i in range(7)]
             calendar_events_found = 0
+            seen_calendar = set()  # (title, date) pairs already added
 
-            for month_date in months_to_check:
-                month_str = month_date.strftime("%Y-%m")
-
+            # Build every candidate URL first, then download them all concurrently
+            month_urls = []
+            month_param_urls = _month_urls(url, [d.strftime("%Y-%m") for d in months_to_check])
+            for month_date, month_param_url in zip(months_to_check, month_param_urls):
                 # Try both base URL and URL with month parameter
                 urls_to_try = []
                 # Only try base URL for current month
                 if month_date.month == current_date.month and month_date.year == current_date.year:
                     urls_to_try.append(url)
                 # For other months, use month parameter
-                if '?' in url:
-                    urls_to_try.append(f"{url.split('?')[0]}?month={month_str}")
-                else:
-                    urls_to_try.append(f"{url}?month={month_str}")
+                urls_to_try.append(month_param_url)
+                month_urls.append(urls_to_try)
+
+            pages = _fetch_all([u for urls_to_try in month_urls for u in urls_to_try],
+                               timeout=10, use_cache=use_cache)
 
+            for urls_to_try in month_urls:
                 for check_url in urls_to_try:
+                    if check_url not in pages:
+                        continue  # Try next URL pattern
+
                     try:
-                        month_resp = requests.get(check_url, headers=headers, timeout=10)
-                        if month_resp.status_code == 200:
-                            month_soup = BeautifulSoup(month_resp.text, "html.parser")
-                            month_table = month_soup.find("table")
-
-                            if month_table:
-                                cells = month_table.find_all("td")
-                                for cell in cells:
-                                    links = cell.find_all("a", href=True)
-                                    data_date = cell.get("data-date")
-
-                                    if links and data_date:
-                                        for link in links:
-                                            event_text = link.get_text(strip=True)
-                                            if event_text and len(event_text) > 3:
-                                                event_url = link.get("href", "")
-                                                if event_url.startswith("/"):
-                                                    event_url = urljoin(url, event_url)
-
-                                                cell_text = cell.get_text()
-                                                time_str = extract_time(cell_text)
-
-                                                # Check if already added (avoid duplicates)
-                                                event_key = f"{event_text}_{data_date}"
-                                                if not any(r.get('title') == event_text and r.get('start', '').startswith(data_date) for r in results):
-                                                    results.append({
-                                                        "title": event_text,
-                                                        "url": event_url,
-                                                        "description": "",
-                                                        "start": f"{data_date}T{time_str}:00",
-                                                        "allDay": False
-                                                    })
-                                                    calendar_events_found += 1
-                                break  # Found table for this URL pattern, move to next month
+                        month_soup = _make_soup(pages[check_url])
+                        month_table = month_soup.find("table")
+
+                        if month_table:
+                            cells = month_table.find_all("td")
+                            for cell in cells:
+                                links = cell.find_all("a", href=True)
+                                data_date = cell.get("data-date")
+
+                                if links and data_date:
+                                    for link in links:
+                                        event_text = link.get_text(strip=True)
+                                        if event_text and len(event_text) > 3:
+                                            event_url = link.get("href", "")
+                                            if event_url.startswith("/"):
+                                                event_url = urljoin(url, event_url)
+
+                                            cell_text = cell.get_text()
+                                            time_str = extract_time(cell_text)
+
+                                            # Check if already added (avoid duplicates)
+                                            event_key = (event_text, data_date)
+                                            if event_key not in seen_calendar:
+                                                seen_calendar.add(event_key)
+                                                results.append({
+                                                    "title": event_text,
+                                                    "url": event_url,
+                                                    "description": "",
+                                                    "start": f"{data_date}T{time_str}:00",
+                                                    "allDay": False
+                                                })
+                                                calendar_events_found += 1
+                            break  # Found table for this URL pattern, move to next month
                     except Exception as e:
                         continue  # Try next URL pattern
 
@@ -2142,58 +2557,52 @@ def scrape_generic_auto(url: str, source_type: str) -> List[Dict]:
         if not results:
             # Enhanced pattern to catch more variations: PlaceView, EventCard, etc.
             containers = soup.find_all(["article", "div", "li", "section"],
-                                      class_=re.compile(r"event|attraction|place|card|item|entry|post|listing|view", re.I))
+                                      class_=_CONTAINER_CLASS_RE_AUTO)
             seen_titles = set()  # Track seen titles to avoid duplicates
             raw_count = len(containers)
             filtered_count = 0
 
             for container in containers:  # No limit - scrape all items found
-                title_elem = container.find(["h2", "h3", "h4", "a"])
+                title_elem, desc_elem, link = _card_fields(container)
                 if not title_elem:
                     continue
 
                 title = title_elem.get_text(strip=True)
 
                 # Clean up title - remove leading numbers, dates, etc.
-                title = re.sub(r'^\d+\s*', '', title)  # Remove leading numbers
-                title = re.sub(r'^\d{1,2}[A-Za-z]+', '', title)  # Remove date prefixes like "13November"
-                # Remove month names at the beginning (like "NovemberEvent Name")
-                title = re.sub(r'^(January|February|March|April|May|June|July|August|September|October|November|December)', '', title, flags=re.IGNORECASE)
+                # Remove leading numbers and month names (like "13NovemberEvent Name")
+                title = _AUTO_TITLE_PREFIX_RE.sub('', title)
                 title = title.strip()
 
-                # Filter out junk titles (UI elements, navigation, etc.) - only exact matches
-                junk_exact = ['log in', 'sign up', 'learn more', 'read more', 'click here',
-                             'menu', 'search', 'home', 'about', 'contact', 'privacy',
-                             'terms', 'getting there', 'share', 'save', 'map', 'photos']
+                title_lower = title.lower()
 
-                # Only filter if it's an EXACT match to junk keywords
-                if title.lower() in junk_exact:
+                # Filter out junk titles (UI elements, navigation, etc.) - only EXACT matches
+                if title_lower in _JUNK_EXACT:
                     continue
 
                 # Very minimal filtering - only remove very short titles and duplicates
-                if len(title) < 3 or title.lower() in seen_titles:
+                if len(title) < 3 or title_lower in seen_titles:
                     continue
 
-                seen_titles.add(title.lower())
+                seen_titles.add(title_lower)
 
                 # Get URL
-                link = container.find("a", href=True)
                 item_url = link.get("href", url) if link else url
                 if item_url.startswith("/"):
                     item_url = urljoin(url, item_url)
 
                 # Get description
-                desc_elem = container.find("p")
-                description = desc_elem.get_text(strip=True)[:200] if desc_elem else ""
+                description = _short_text(desc_elem) if desc_elem else ""
 
                 # For events, try to find date
                 if source_type == 'events':
                     # Try multiple strategies to extract date
                     dt = None
                     date_text = ""
+                    container_text = None  # Full container text, computed at most once
 
                     # Strategy 1: Look for time/date elements
-                    date_elem = container.find(["time", "span", "div"], class_=re.compile(r"date|time", re.I))
+                    date_elem = container.find(["time", "span", "div"], class_=_DATE_CLASS_RE)
                     if date_elem:
                         date_text = date_elem.get_text(strip=True)
 
@@ -2201,11 +2610,11 @@ def scrape_generic_auto(url: str, source_type: str) -> List[Dict]:
                     if not date_text or len(date_text) < 3:
                         # Search for month names in the container
                         container_text = container.get_text()
-                        month_match = re.search(r'(January|February|March|April|May|June|July|August|September|October|November|December)', container_text, re.I)
+                        month_match = _MONTH_NAME_RE.search(container_text)
                         if month_match:
                             month_name = month_match.group(1)
                             # Try to find a day number nearby
-                            day_match = re.search(r'\b(\d{1,2})\b', container_text)
+                            day_match = _DAY_NUM_RE.search(container_text)
                             if day_match:
                                 day_num = day_match.group(1)
                                 date_text = f"{month_name} {day_num}"
@@ -2213,13 +2622,15 @@ def scrape_generic_auto(url: str, source_type: str) -> List[Dict]:
                     # Parse the date
                     if date_text:
                         try:
-                            dt = dateparser.parse(date_text)
+                            dt = _parse_date(date_text)
                             if dt:
                                 # If the parsed date is in the past, assume it's for next year
                                 if dt.date() < datetime.now().date():
                                     dt = dt.replace(year=dt.year + 1)
 
                                 date_str = dt.strftime("%Y-%m-%d")
+                                if container_text is None:
+                                    container_text = container.get_text()
                                 time_str = extract_time(container_text)
                                 results.append({
                                     "title": title,
@@ -2232,19 +2643,14 @@ def scrape_generic_auto(url: str, source_type: str) -> List[Dict]:
                         except Exception as e:
                             pass
                 else:
-                    # For attractions
-                    today = datetime.now().strftime("%Y-%m-%d")
-                    import random
-                    time_str = f"{random.randint(9, 17):02d}:00"
-
-                    # Don't add "Visit:" prefix if title already has it
-                    display_title = title if title.startswith(("Visit:", "Visit ")) else title
+                    # For attractions: spread items over the day in a fixed rotation
+                    time_str = _ATTRACTION_TIMES[filtered_count % len(_ATTRACTION_TIMES)]
 
                     results.append({
-                        "title": display_title,
+                        "title": title,
                         "url": item_url,
                         "description": description,
-                        "start": f"{today}T{time_str}:00",
+                        "start": f"{today_str}T{time_str}:00",
                         "allDay": False
                     })
                     filtered_count += 1
@@ -2256,69 +2662,75 @@ def scrape_generic_auto(url: str, source_type: str) -> List[Dict]:
         # Pattern 3: Fallback for article-style pages with h2/h3/h4 headers (like Explore Georgia)
         # Use this when we haven't found many results and we're looking for attractions
         if source_type == 'attractions' and len(results) < 20:
-            article_headers = soup.find_all(["h2", "h3", "h4"])
-            seen_titles_article = {r['title'].lower() for r in results}  # Track already found
+            article_headers = soup.select("h2, h3, h4")
+            seen_titles_article = set(map(str.lower, (r['title'] for r in results)))  # Track already found
 
             for header in article_headers:
                 title = header.get_text(strip=True)
+                title_lower = title.lower()
 
                 # Skip if title is too short or looks like a section header
-                if len(title) < 3 or title.lower() in ["things to do", "attractions", "events", "overview", "about"]:
+                if len(title) < 3 or title_lower in _GENERIC_HEADERS:
                     continue
 
                 # Skip if already found
-                if title.lower() in seen_titles_article:
+                if title_lower in seen_titles_article:
                     continue
 
-                seen_titles_article.add(title.lower())
+                seen_titles_article.add(title_lower)
 
                 # Find the following paragraph for description
                 description = ""
                 next_elem = header.find_next_sibling(["p", "div"])
                 if next_elem:
-                    description = next_elem.get_text(strip=True)[:200]
+                    description = _short_text(next_elem)
 
                 # Try to find a link
                 link = header.find("a") or (next_elem.find("a") if next_elem else None)
-                attraction_url = urljoin(url, link["href"]) if link and link.get("href") else url
+                href = link.get("href") if link else None
+                if not href:
+                    attraction_url = url
+                elif href.startswith(("http:", "https:")):
+                    attraction_url = href  # Already absolute, no need to parse and rejoin
+                else:
+                    attraction_url = urljoin(url, href)
 
                 results.append({
                     "title": title,
                     "url": attraction_url,
                     "description": description,
-                    "start": datetime.now().strftime("%Y-%m-%dT10:00:00"),
+                    "start": f"{today_str}T10:00:00",
                     "allDay": False
                 })
 
             if len(article_headers) > 0:
                 print(f"  Article-style fallback pattern found {len(article_headers)} headers, added {len(results) - filtered_count} new items")
 
-        # Filter out past events (use yesterday as cutoff for UTC server offset)
+        # Filter out past events (use yesterday as cutoff for UTC server offset) and
+        # deduplicate events on the same date with similar titles in a single pass
         if source_type == 'events':
             before_filter = len(results)
-            current_date = (datetime.now() - timedelta(days=1)).date()
-            results = [r for r in results if datetime.fromisoformat(r['start'].split('T')[0]).date() >= current_date]
-            if before_filter > len(results):
-                print(f"  Filtered out {before_filter - len(results)} past events (before: {before_filter}, after: {len(results)})")
-
-        # Deduplicate events on the same date with similar titles
-        if source_type == 'events':
+            # 'start' begins with an ISO YYYY-MM-DD date, so plain string comparison orders dates
+            cutoff = (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
+            past_count = 0
             deduplicated = []
+            append = deduplicated.append
             seen = set()
 
             for event in results:
-                event_date = event['start'].split('T')[0]
-                # Normalize title for comparison (lowercase, remove extra spaces)
-                normalized_title = ' '.join(event['title'].lower().split())
-                # Create key from date + first 30 chars of normalized title
-                key = f"{event_date}_{normalized_title[:30]}"
-
+                start_date = event['start'][:10]
+                if start_date < cutoff:
+                    past_count += 1
+                    continue
+                key = _dedupe_key(event['title'], start_date)
                 if key not in seen:
                     seen.add(key)
-                    deduplicated.append(event)
+                    append(event)
 
-            if len(deduplicated) < len(results):
-                print(f"  Removed {len(results) - len(deduplicated)} duplicate events")
+            if past_count:
+                print(f"  Filtered out {past_count} past events (before: {before_filter}, after: {before_filter - past_count})")
+            if len(deduplicated) < before_filter - past_count:
+                print(f"  Removed {before_filter - past_count - len(deduplicated)} duplicate events")
             results = deduplicated
 
         print(f"Generic auto scraping found {len(results)} items from {url}")
@@ -2330,43 +2742,23 @@ def scrape_generic_auto(url: str, source_type: str) -> List[Dict]:
 
 
 def extract_time(text: str) -> str:
-    """Extract time from text, return HH:MM format"""
-    time_patterns = [
-        r'(\d{1,2}):(\d{2})\s*(?:AM|PM|am|pm)',
-        r'(\d{1,2})\s*(?:AM|PM|am|pm)',
-    ]
-
-    for pattern in time_patterns:
-        match = re.search(pattern, text, re.I)
-        if match:
-            try:
-                if len(match.groups()) == 2:
-                    hour, minute = match.groups()
-                    hour_int = int(hour)
-                    if 'PM' in match.group(0).upper() and hour_int != 12:
-                        hour_int += 12
-                    elif 'AM' in match.group(0).upper() and hour_int == 12:
-                        hour_int = 0
-                    return f"{hour_int:02d}:{minute}"
-                else:
-                    hour = match.group(1)
-                    hour_int = int(hour)
-                    if 'PM' in match.group(0).upper() and hour_int != 12:
-                        hour_int += 12
-                    elif 'AM' in match.group(0).upper() and hour_int == 12:
-                        hour_int = 0
-                    return f"{hour_int:02d}:00"
-            except (ValueError, IndexError):
-                pass
+    """
+    Extract time from text, return HH:MM format.
+    The text is lowercased once and every check below reuses it.
+    """
+    text_lower = text.lower()
+
+    # The first time in the text wins, with or without minutes. Matching the lowercased
+    # text lets _TIME_RE skip case-insensitive comparisons.
+    # Most texts have no digits at all, so check that cheaply before the full pattern.
+    match = _TIME_RE.search(text_lower) if text_lower and _DIGIT_RE.search(text_lower) else None
+    if match:
+        # 12 AM -> 00, 12 PM -> 12, other PM hours +12
+        hour_int = int(match.group('hour')) % 12 + (12 if match.group('ampm') == "p" else 0)
+        return f"{hour_int:02d}:{match.group('minute') or '00'}"
 
     # Default times based on context
-    import random
-    text_lower = text.lower()
-    if any(word in text_lower for word in ["morning", "breakfast", "brunch"]):
-        return f"{random.randint(8, 11):02d}:00"
-    elif any(word in text_lower for word in ["lunch", "noon", "afternoon"]):
-        return f"{random.randint(12, 14):02d}:00"
-    elif any(word in text_lower for word in ["evening", "dinner", "night"]):
-        return f"{random.randint(18, 21):02d}:00"
-    else:
-        return f"{random.randint(10, 17):02d}:00"
+    for word, default_time in _CONTEXT_TIMES:
+        if word in text_lower:
+            return default_time
+    return _DEFAULT_TIME
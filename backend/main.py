@@ -119,10 +119,11 @@ class SourceUpdateRequest(BaseModel):
 # TripAdvisor blocks scraping and is not supported
 # -----------------------------
 
-def scrape_source(source: Dict) -> List[Dict]:
+def scrape_source(source: Dict, use_cache: bool = False) -> List[Dict]:
     """
     Scrape a single source using the appropriate method.
     Supports 'auto' (generic pattern matching), 'ai' (AI-powered), and 'ai_twostage' (two-stage AI scraping).
+    use_cache is the category's cache setting; it lets the scrapers reuse recently fetched pages.
     """
     url = source['url']
     source_type = source['type']
@@ -132,12 +133,12 @@ def scrape_source(source: Dict) -> List[Dict]:
         # Method 1: AI-powered scraping (including two-stage)
         if scraping_method in ['ai', 'ai_twostage'] and client is not None:
             print(f"  Using {scraping_method} scraping for {url}")
-            return generic_scraper.scrape_with_ai(url, source_type, client, scraping_method)
+            return generic_scraper.scrape_with_ai(url, source_type, client, scraping_method, use_cache)
 
         # Method 2: Generic auto-detection (default for 'auto' method or fallback)
         else:
             print(f"  Using generic auto-detection for {url}")
-            return generic_scraper.scrape_generic_auto(url, source_type)
+            return generic_scraper.scrape_generic_auto(url, source_type, use_cache)
 
     except Exception as e:
         print(f"Error scraping {url}: {e}")
@@ -215,7 +216,7 @@ def generate_events(request: QueryRequest):
                 if raw_output.endswith("```"):
                     raw_output = raw_output[:-3].strip()
                 try:
-                    gpt_events = json.loads(raw_output)
+                    gpt_events = generic_scraper.json_loads(raw_output)
                     # Assign deterministic dates within month/year
                     for idx, ev in enumerate(gpt_events):
                         ev_date = datetime(year, month_number, min(idx+1,28))  # avoid overflow
@@ -954,7 +955,7 @@ async def generate_events_stream(category: str = "events"):
                 valid_sources = [s for s in sources if s['type'] == category]
                 print(f"[{category.upper()}] Launching {len(valid_sources)} sources in parallel")
                 pending_futures = {
-                    asyncio.ensure_future(loop.run_in_executor(executor, scrape_source, source)): source
+                    asyncio.ensure_future(loop.run_in_executor(executor, scrape_source, source, cache_enabled)): source
                     for source in valid_sources
                 }
 
@@ -1022,7 +1023,7 @@ async def generate_events_stream(category: str = "events"):
                         print(f"Scraping attraction source: {source['name']} ({source['url']})")
 
                         # Run blocking scrape_source in thread pool to avoid blocking the event loop
-                        attractions = await loop.run_in_executor(executor, scrape_source, source)
+                        attractions = await loop.run_in_executor(executor, scrape_source, source, cache_enabled)
                         current += 1
 
                         # Extract categories for each attraction
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Test the date helpers: strptime fast paths and partial dates vs dateutil, _nth_weekday and _month_urls"""
+import os
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'backend'))
+
+from datetime import date, datetime
+from dateutil import parser as dateparser
+from dateutil.relativedelta import relativedelta, FR, SA, TU
+
+from generic_scraper import _parse_date, _parse_date_cached, _nth_weekday, _month_urls
+
+failures = 0
+
+
+def check(label, result, expected):
+    global failures
+    status = "✓" if result == expected else "✗"
+    if result != expected:
+        failures += 1
+    print(f"  {status} {label}: {result} (expected {expected})")
+
+
+# 1. _parse_date_cached fast paths must give exactly what dateutil gives
+#    (same default: missing fields come from today at midnight)
+print('Testing _parse_date_cached against dateutil...')
+print('=' * 60)
+today = date(2026, 10, 15)
+date_strings = [
+    # _NUMERIC_DATE_FORMATS
+    "2026-10-18", "2027-01-05", "05/06/2026", "1/2/2026", "12/31/2026",
+    # _MONTH_NAME_DATE_FORMATS
+    "October 15, 2026", "Oct 15, 2026", "MAY 5, 2027", "Feb 29, 2028",
+    # _YEARLESS_DATE_FORMATS
+    "March 5", "Mar 5", "march 05", "Dec 31", "May 5", "Feb 28",
+    # Shapes the fast paths don't cover - must still fall back to dateutil
+    "Feb 29", "Sept 5", "March 5th", "Saturday, March 5", "15 October 2026", "2026-1-5",
+]
+for date_str in date_strings:
+    try:
+        expected = dateparser.parse(date_str, default=datetime(today.year, today.month, today.day), fuzzy=False)
+    except (ValueError, OverflowError):
+        expected = None
+    check(repr(date_str), _parse_date_cached(date_str, today), expected)
+
+# 1b. Partial dates (time-only cells, bare day numbers, weekday or month names) must keep the
+#     original behaviour: plain dateutil.parser.parse(), which fills missing fields from today
+print('\nTesting partial dates against plain dateutil.parser.parse...')
+print('=' * 60)
+real_today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+partial_cases = [
+    ("7:00 PM", real_today.replace(hour=19)),
+    ("10am", real_today.replace(hour=10)),
+    ("15", real_today.replace(day=15)),
+    ("March", real_today.replace(month=3)),
+    ("Saturday", dateparser.parse("Saturday")),
+]
+for date_str, expected in partial_cases:
+    check(repr(date_str), _parse_date(date_str), expected)
+
+# 2. _nth_weekday against dateutil's weekday(+n) for every month of two years
+print('\nTesting _nth_weekday against relativedelta weekdays...')
+print('=' * 60)
+patterns = [("first Friday", 4, 1, FR(+1)), ("second Saturday", 5, 2, SA(+2)), ("third Tuesday", 1, 3, TU(+3))]
+for name, weekday, nth, rd_weekday in patterns:
+    mismatches = []
+    for year in (2026, 2027):
+        for month in range(1, 13):
+            expected = datetime(year, month, 1) + relativedelta(weekday=rd_weekday)
+            if _nth_weekday(year, month, weekday, nth) != expected:
+                mismatches.append(f"{year}-{month:02d}")
+    check(f"{name} (24 months)", mismatches, [])
+
+# 3. _month_urls sets ?month= and keeps the other query params
+print('\nTesting _month_urls...')
+print('=' * 60)
+check("plain URL",
+      _month_urls("https://example.com/calendar", ["2026-11", "2026-12"]),
+      ["https://example.com/calendar?month=2026-11", "https://example.com/calendar?month=2026-12"])
+check("existing params kept, month replaced, fragment dropped",
+      _month_urls("https://example.com/cal?cat=arts&month=2026-10#top", ["2026-11"]),
+      ["https://example.com/cal?cat=arts&month=2026-11"])
+check("no months", _month_urls("https://example.com/calendar", []), [])
+
+print('=' * 60)
+print("All passed" if not failures else f"{failures} failed")
+sys.exit(1 if failures else 0)
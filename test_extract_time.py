@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""Test extract_time: explicit times and the fixed default time for each context keyword"""
+import os
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'backend'))
+
+from generic_scraper import extract_time
+
+test_cases = [
+    # Explicit times win over context words
+    ("Doors open at 7:30 PM", "19:30"),
+    ("Starts 9am sharp", "09:00"),
+    ("Midnight show 12 AM", "00:00"),
+    ("Lunch at 12:15 pm", "12:15"),
+    ("Morning session 10:45 AM", "10:45"),
+    # Context keyword defaults
+    ("Saturday morning market", "09:00"),
+    ("Pancake Breakfast", "09:00"),
+    ("Sunday Brunch", "09:00"),
+    ("Afternoon tea", "14:00"),
+    ("Lunch and learn", "12:00"),
+    ("Noon concert", "12:00"),
+    ("Evening on the lawn", "19:00"),
+    ("Dinner theater", "19:00"),
+    ("Trivia night", "19:00"),
+    # No time and no context word
+    ("Art exhibit opening", "10:00"),
+    ("", "10:00"),
+]
+
+print('Testing extract_time...')
+print('=' * 60)
+failures = 0
+for text, expected in test_cases:
+    result = extract_time(text)
+    status = "✓" if result == expected else "✗"
+    if result != expected:
+        failures += 1
+    print(f"  {status} {text!r:35} → {result} (expected {expected})")
+
+print('=' * 60)
+print(f"{len(test_cases) - failures}/{len(test_cases)} passed")
+sys.exit(1 if failures else 0)